@@ -0,0 +1,200 @@
+"""
+Allocation micro-benchmark for the result models.
+
+    python benchmarks/allocations.py [--checks 10] [--out allocations.json]
+
+Compares the current models and registry against the original `@dataclass` models
+and registry run (reproduced below as the "before" reference): memory blocks and bytes
+kept alive per readiness result, the cost of building and serialising one readiness
+response, and the allocations of a full `readiness()` run.
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import sys
+import time
+import tracemalloc
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from typing import Any, Callable, Dict, List, Optional
+
+from pulsecheck.core import HealthCheckResult, HealthRegistry, HealthStatus, OverallHealthResponse
+from pulsecheck.core.checks import CheckConfig, HealthCheck
+from pulsecheck.core.status import combine_status
+
+
+@dataclass
+class LegacyHealthCheckResult:
+    status: HealthStatus
+    response_time_ms: Optional[float] = None
+    error: Optional[str] = None
+    meta: Dict[str, Any] = field(default_factory=dict)
+
+
+@dataclass
+class LegacyOverallHealthResponse:
+    status: HealthStatus
+    timestamp: datetime
+    environment: str
+    checks: Dict[str, LegacyHealthCheckResult]
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "status": self.status.value,
+            "timestamp": self.timestamp.isoformat(),
+            "environment": self.environment,
+            "checks": {
+                name: {
+                    "status": res.status.value,
+                    **({"response_time_ms": res.response_time_ms} if res.response_time_ms is not None else {}),
+                    **({"error": res.error} if res.error else {}),
+                    **({"meta": res.meta} if res.meta else {}),
+                }
+                for name, res in self.checks.items()
+            },
+        }
+
+
+def legacy_combine_status(current: HealthStatus, incoming: HealthStatus) -> HealthStatus:
+    if current == HealthStatus.UNHEALTHY or incoming == HealthStatus.UNHEALTHY:
+        return HealthStatus.UNHEALTHY
+    if current == HealthStatus.DEGRADED or incoming == HealthStatus.DEGRADED:
+        return HealthStatus.DEGRADED
+    return HealthStatus.HEALTHY
+
+
+class LegacyHealthRegistry:
+    """The original registry run: semaphore + gather, building legacy models."""
+
+    def __init__(self, *, environment: str, max_concurrency: int = 10) -> None:
+        self.environment = environment
+        self._checks: List[Any] = []
+        self._max_concurrency = max_concurrency
+
+    def register(self, check: Any) -> None:
+        self._checks.append(check)
+
+    async def readiness(self) -> LegacyOverallHealthResponse:
+        checks_out: Dict[str, LegacyHealthCheckResult] = {}
+        overall = HealthStatus.HEALTHY
+        sem = asyncio.Semaphore(self._max_concurrency)
+
+        async def _run_one(c) -> None:
+            nonlocal overall
+            async with sem:
+                if not c.config.readiness:
+                    return
+                try:
+                    res = await c.check()
+                except Exception as e:
+                    res = LegacyHealthCheckResult(status=HealthStatus.UNHEALTHY, error=f"Check crashed: {repr(e)}")
+                checks_out[c.config.name] = res
+                overall = legacy_combine_status(overall, res.status)
+
+        await asyncio.gather(*[_run_one(c) for c in self._checks])
+        return LegacyOverallHealthResponse(status=overall, timestamp=datetime.now(timezone.utc), environment=self.environment, checks=checks_out)
+
+
+def _build(result_cls, response_cls, combine, n_checks: int):
+    overall = HealthStatus.HEALTHY
+    checks = {}
+    for i in range(n_checks):
+        res = result_cls(status=HealthStatus.HEALTHY, response_time_ms=1.5)
+        checks[f"check-{i}"] = res
+        overall = combine(overall, res.status)
+    return response_cls(status=overall, timestamp=datetime.now(timezone.utc), environment="bench", checks=checks)
+
+
+def _retained(make: Callable[[], Any], count: int) -> Dict[str, float]:
+    """Blocks and bytes kept alive per object, measured while `count` of them are held."""
+    tracemalloc.start()
+    try:
+        before = tracemalloc.take_snapshot()
+        keep = [make() for _ in range(count)]
+        after = tracemalloc.take_snapshot()
+    finally:
+        tracemalloc.stop()
+    diff = after.compare_to(before, "filename")
+    blocks = sum(d.count_diff for d in diff) - 1  # minus the holding list
+    size = sum(d.size_diff for d in diff) - sys.getsizeof(keep)
+    return {"blocks": blocks / count, "bytes": size / count}
+
+
+def _per_op_us(fn: Callable[[], Any], iterations: int) -> float:
+    start = time.perf_counter()
+    for _ in range(iterations):
+        fn()
+    return (time.perf_counter() - start) / iterations * 1e6
+
+
+class NoopCheck(HealthCheck):
+    def __init__(self, config: CheckConfig, result_cls: Any = HealthCheckResult) -> None:
+        super().__init__(config)
+        self._result_cls = result_cls
+
+    async def check(self) -> Any:
+        return self._result_cls(status=HealthStatus.HEALTHY, response_time_ms=0.0)
+
+
+def _readiness_run(registry_cls: Any, result_cls: Any, n_checks: int, iterations: int) -> Dict[str, float]:
+    """Peak bytes allocated by one `readiness()` run over `n_checks` no-op checks, and its time."""
+    registry = registry_cls(environment="bench")
+    for i in range(n_checks):
+        registry.register(NoopCheck(CheckConfig(name=f"noop-{i}"), result_cls))
+
+    async def _run() -> Dict[str, float]:
+        await registry.readiness()
+        tracemalloc.start()
+        try:
+            peaks = []
+            for _ in range(iterations):
+                tracemalloc.reset_peak()
+                base, _ = tracemalloc.get_traced_memory()
+                await registry.readiness()
+                peaks.append(tracemalloc.get_traced_memory()[1] - base)
+        finally:
+            tracemalloc.stop()
+
+        start = time.perf_counter()
+        for _ in range(iterations):
+            await registry.readiness()
+        run_us = (time.perf_counter() - start) / iterations * 1e6
+        return {"peak_bytes": sum(peaks) / len(peaks), "run_us": run_us}
+
+    return asyncio.run(_run())
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Allocation micro-benchmark for PulseCheck result models.")
+    parser.add_argument("--checks", type=int, default=10)
+    parser.add_argument("--out", help="write results as JSON to this file")
+    args = parser.parse_args(argv)
+
+    n = args.checks
+    variants = {
+        "before": (LegacyHealthCheckResult, LegacyOverallHealthResponse, legacy_combine_status, LegacyHealthRegistry),
+        "after": (HealthCheckResult, OverallHealthResponse, combine_status, HealthRegistry),
+    }
+    report: Dict[str, Any] = {"checks": n}
+    for label, (result_cls, response_cls, combine, registry_cls) in variants.items():
+        report[label] = {
+            "result": _retained(lambda: result_cls(status=HealthStatus.HEALTHY, response_time_ms=1.5), 10_000),
+            "response": _retained(lambda: _build(result_cls, response_cls, combine, n), 1_000),
+            "build_us": _per_op_us(lambda: _build(result_cls, response_cls, combine, n), 5_000),
+            "build_and_to_dict_us": _per_op_us(lambda: _build(result_cls, response_cls, combine, n).to_dict(), 5_000),
+            "readiness": _readiness_run(registry_cls, result_cls, n, 200),
+        }
+
+    if args.out:
+        with open(args.out, "w") as f:
+            json.dump(report, f, indent=2)
+    else:
+        json.dump(report, sys.stdout, indent=2)
+        print()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
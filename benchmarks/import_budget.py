@@ -0,0 +1,92 @@
+"""
+Import-time and module-count budget for `import pulsecheck.core`.
+
+    python benchmarks/import_budget.py [--max-ms 50] [--max-modules 40] [--runs 7]
+
+Each run imports the package in a fresh interpreter and records the wall time of
+the import and the number of modules it added to `sys.modules`. `asyncio` is
+imported first and not counted: every user of the package pays for it anyway, and
+it dominates (and varies with) the interpreter build. The best run is compared
+against the budget, and the import must not pull in any optional dependency.
+Exits non-zero when the budget is exceeded, so it can gate CI.
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import subprocess
+import sys
+from typing import Any, Dict, List, Optional
+
+# Never imported by `pulsecheck.core`; each is loaded on first use of the feature needing it.
+FORBIDDEN = (
+    "importlib.metadata",
+    "fastapi",
+    "starlette",
+    "django",
+    "sqlalchemy",
+    "redis",
+    "httpx",
+    "kombu",
+    "celery",
+    "orjson",
+)
+
+_PROBE = """
+import asyncio, json, sys, time
+before = set(sys.modules)
+start = time.perf_counter()
+import {module}
+elapsed = time.perf_counter() - start
+added = sorted(set(sys.modules) - before)
+print(json.dumps({{"ms": elapsed * 1000.0, "added": added}}))
+"""
+
+
+def measure(module: str) -> Dict[str, Any]:
+    out = subprocess.run(
+        [sys.executable, "-c", _PROBE.format(module=module)],
+        check=True,
+        capture_output=True,
+        text=True,
+    ).stdout
+    return json.loads(out)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Import-time budget for pulsecheck.core.")
+    parser.add_argument("--module", default="pulsecheck.core")
+    parser.add_argument("--max-ms", type=float, default=50.0)
+    parser.add_argument("--max-modules", type=int, default=40)
+    parser.add_argument("--runs", type=int, default=7)
+    args = parser.parse_args(argv)
+
+    runs = [measure(args.module) for _ in range(args.runs)]
+    best_ms = min(r["ms"] for r in runs)
+    added = runs[0]["added"]
+    forbidden = sorted(m for m in added if m.split(".")[0] in FORBIDDEN or m in FORBIDDEN)
+
+    report = {
+        "module": args.module,
+        "import_ms": round(best_ms, 2),
+        "modules_added": len(added),
+        "forbidden": forbidden,
+        "budget": {"max_ms": args.max_ms, "max_modules": args.max_modules},
+    }
+    json.dump(report, sys.stdout, indent=2)
+    print()
+
+    failures = []
+    if best_ms > args.max_ms:
+        failures.append(f"import took {best_ms:.1f} ms (budget {args.max_ms:g} ms)")
+    if len(added) > args.max_modules:
+        failures.append(f"import added {len(added)} modules (budget {args.max_modules})")
+    if forbidden:
+        failures.append(f"import pulled in optional dependencies: {', '.join(forbidden)}")
+    for failure in failures:
+        print(f"FAIL: {failure}", file=sys.stderr)
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,286 @@
+"""
+PulseCheck benchmark harness.
+
+    python benchmarks/run.py --out results.json
+    python benchmarks/run.py --compare baseline.json --out results.json
+
+Everything runs in-process against the stand-ins in `stand_ins.py`; the results are
+written as JSON so runs from different versions can be compared.
+Requires: fastapi, httpx, redis, SQLAlchemy (`pip install pulsecheck-py[bench]`).
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import os
+import platform
+import statistics
+import sys
+import time
+import tracemalloc
+from datetime import datetime, timezone
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from stand_ins import FakeHttpDependency, FakeRedis, sqlite_engine  # noqa: E402
+
+from pulsecheck.core import HealthCheckResult, HealthRegistry, HealthStatus  # noqa: E402
+from pulsecheck.core.checks import CheckConfig, HealthCheck  # noqa: E402
+
+
+class NoopCheck(HealthCheck):
+    async def check(self) -> HealthCheckResult:
+        return HealthCheckResult(status=HealthStatus.HEALTHY, response_time_ms=0.0)
+
+
+def _summary(samples_s: List[float]) -> Dict[str, float]:
+    ms = sorted(s * 1000.0 for s in samples_s)
+
+    def pct(p: float) -> float:
+        return ms[min(len(ms) - 1, int(p * len(ms)))]
+
+    return {
+        "mean_ms": statistics.fmean(ms),
+        "p50_ms": pct(0.50),
+        "p90_ms": pct(0.90),
+        "p99_ms": pct(0.99),
+        "max_ms": ms[-1],
+    }
+
+
+async def _timed(fn: Callable[[], Awaitable[Any]], iterations: int) -> List[float]:
+    samples = []
+    for _ in range(iterations):
+        start = time.perf_counter()
+        await fn()
+        samples.append(time.perf_counter() - start)
+    return samples
+
+
+def _noop_registry(n_checks: int) -> HealthRegistry:
+    registry = HealthRegistry(environment="bench")
+    for i in range(n_checks):
+        registry.register(NoopCheck(CheckConfig(name=f"noop-{i}")))
+    return registry
+
+
+async def bench_registry_overhead(check_counts: List[int], iterations: int) -> List[Dict[str, Any]]:
+    out = []
+    for n in check_counts:
+        registry = _noop_registry(n)
+        await _timed(registry.readiness, 50)
+        samples = await _timed(registry.readiness, iterations)
+        out.append({
+            "name": "registry_overhead",
+            "params": {"checks": n},
+            "ops_per_s": iterations / sum(samples),
+            **_summary(samples),
+        })
+    return out
+
+
+async def bench_stand_ins(iterations: int) -> List[Dict[str, Any]]:
+    from pulsecheck.core.checks import HttpDependencyCheck, RedisAsyncCheck, SQLAlchemySyncCheck
+
+    redis_srv = await FakeRedis().start()
+    http_srv = await FakeHttpDependency().start()
+    registry = HealthRegistry(environment="bench")
+    registry.register(RedisAsyncCheck(redis_srv.url))
+    registry.register(HttpDependencyCheck(http_srv.url, name="http"))
+    registry.register(SQLAlchemySyncCheck(sqlite_engine()))
+
+    try:
+        res = await registry.readiness()
+        if res.status == HealthStatus.UNHEALTHY:
+            raise RuntimeError(f"Stand-ins are not healthy: {res.to_dict()}")
+        samples = await _timed(registry.readiness, iterations)
+    finally:
+        # Releases the pools the checks own; releases before 0.3 have no stop().
+        stop = getattr(registry, "stop", None)
+        if stop is not None:
+            await stop()
+        await redis_srv.stop()
+        await http_srv.stop()
+
+    return [{
+        "name": "stand_in_run",
+        "params": {"checks": 3},
+        "ops_per_s": iterations / sum(samples),
+        "connections": {"redis": redis_srv.connections, "http": http_srv.connections},
+        **_summary(samples),
+    }]
+
+
+async def bench_ready_endpoint(check_counts: List[int], concurrencies: List[int], requests: int) -> List[Dict[str, Any]]:
+    import httpx
+    from fastapi import FastAPI
+
+    from pulsecheck.fastapi import make_health_router
+
+    out = []
+    for n in check_counts:
+        app = FastAPI()
+        app.include_router(make_health_router(_noop_registry(n)))
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+            for _ in range(50):
+                await client.get("/health/ready")
+
+            for concurrency in concurrencies:
+                samples: List[float] = []
+                per_worker = max(1, requests // concurrency)
+
+                async def worker() -> None:
+                    for _ in range(per_worker):
+                        start = time.perf_counter()
+                        resp = await client.get("/health/ready")
+                        samples.append(time.perf_counter() - start)
+                        if resp.status_code != 200:
+                            raise RuntimeError(f"/ready returned {resp.status_code}")
+
+                wall = time.perf_counter()
+                await asyncio.gather(*(worker() for _ in range(concurrency)))
+                wall = time.perf_counter() - wall
+                out.append({
+                    "name": "ready_endpoint",
+                    "params": {"checks": n, "concurrency": concurrency},
+                    "ops_per_s": len(samples) / wall,
+                    **_summary(samples),
+                })
+    return out
+
+
+async def bench_fast_path(middleware_layers: int, requests: int) -> List[Dict[str, Any]]:
+    """`/health/live` through the APIRouter vs. the raw ASGI middleware, behind typical app middleware."""
+    import httpx
+    from fastapi import FastAPI
+    from starlette.middleware.base import BaseHTTPMiddleware
+
+    import pulsecheck.fastapi
+    from pulsecheck.fastapi import make_health_router
+
+    async def passthrough(request, call_next):
+        return await call_next(request)
+
+    registry = _noop_registry(1)
+    app = FastAPI()
+    app.include_router(make_health_router(registry))
+    for _ in range(middleware_layers):
+        app.add_middleware(BaseHTTPMiddleware, dispatch=passthrough)
+
+    variants = [("router", app)]
+    # The raw ASGI middleware arrived in 0.3; earlier releases only get the router numbers.
+    middleware = getattr(pulsecheck.fastapi, "HealthASGIMiddleware", None)
+    if middleware is not None:
+        variants.append(("asgi_middleware", middleware(app, registry)))
+
+    out = []
+    for variant, asgi_app in variants:
+        transport = httpx.ASGITransport(app=asgi_app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+            for _ in range(50):
+                await client.get("/health/live")
+            samples = await _timed(lambda: client.get("/health/live"), requests)
+        out.append({
+            "name": "live_fast_path",
+            "params": {"variant": variant, "middleware_layers": middleware_layers},
+            "ops_per_s": requests / sum(samples),
+            **_summary(samples),
+        })
+    return out
+
+
+async def bench_memory(check_counts: List[int], iterations: int) -> List[Dict[str, Any]]:
+    out = []
+    for n in check_counts:
+        registry = _noop_registry(n)
+        await _timed(registry.readiness, 50)
+
+        tracemalloc.start()
+        try:
+            tracemalloc.reset_peak()
+            base, _ = tracemalloc.get_traced_memory()
+            await registry.readiness()
+            _, peak = tracemalloc.get_traced_memory()
+
+            before, _ = tracemalloc.get_traced_memory()
+            for _ in range(iterations):
+                await registry.readiness()
+            after, _ = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+
+        out.append({
+            "name": "memory_per_request",
+            "params": {"checks": n},
+            "peak_bytes": peak - base,
+            "retained_bytes_per_request": (after - before) / iterations,
+        })
+    return out
+
+
+async def run_all(quick: bool) -> List[Dict[str, Any]]:
+    iterations = 200 if quick else 2000
+    results: List[Dict[str, Any]] = []
+    results += await bench_registry_overhead([1, 10, 50], iterations)
+    results += await bench_stand_ins(iterations // 4)
+    results += await bench_ready_endpoint([1, 10], [1, 10, 50], iterations)
+    results += await bench_fast_path(3, iterations)
+    results += await bench_memory([1, 10], iterations // 4)
+    return results
+
+
+def _key(result: Dict[str, Any]) -> str:
+    return result["name"] + json.dumps(result["params"], sort_keys=True)
+
+
+def compare(old: Dict[str, Any], new: Dict[str, Any]) -> None:
+    previous = {_key(r): r for r in old["results"]}
+    fields = ("ops_per_s", "p50_ms", "p99_ms", "peak_bytes")
+    print(f"{'benchmark':<60} {'metric':<12} {'old':>12} {'new':>12} {'change':>8}")
+    for r in new["results"]:
+        o = previous.get(_key(r))
+        if o is None:
+            continue
+        for f in fields:
+            if f in r and f in o and o[f]:
+                change = (r[f] - o[f]) / o[f] * 100.0
+                print(f"{_key(r):<60} {f:<12} {o[f]:>12.3f} {r[f]:>12.3f} {change:>+7.1f}%")
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Benchmark PulseCheck against in-process stand-ins.")
+    parser.add_argument("--out", help="write results as JSON to this file")
+    parser.add_argument("--compare", help="JSON results of an earlier run to compare against")
+    parser.add_argument("--quick", action="store_true", help="fewer iterations, for smoke runs")
+    args = parser.parse_args(argv)
+
+    import pulsecheck
+
+    report = {
+        "meta": {
+            "pulsecheck": pulsecheck.__version__,
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "timestamp": datetime.now(timezone.utc).isoformat(),
+        },
+        "results": asyncio.run(run_all(args.quick)),
+    }
+
+    if args.out:
+        with open(args.out, "w") as f:
+            json.dump(report, f, indent=2)
+    else:
+        json.dump(report, sys.stdout, indent=2)
+        print()
+
+    if args.compare:
+        with open(args.compare) as f:
+            compare(json.load(f), report)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,117 @@
+"""
+In-process stand-ins for the dependencies PulseCheck probes, so benchmarks need no
+external services: a RESP-speaking Redis, an HTTP health endpoint and a SQLite engine.
+"""
+from __future__ import annotations
+
+import asyncio
+from typing import List, Optional
+
+
+class FakeRedis:
+    """Answers PING with PONG, HELLO with the requested protocol and every other command with OK."""
+
+    def __init__(self) -> None:
+        self._server: Optional[asyncio.AbstractServer] = None
+        self.connections = 0
+        self.commands = 0
+
+    @property
+    def url(self) -> str:
+        host, port = self._server.sockets[0].getsockname()[:2]  # type: ignore[union-attr]
+        return f"redis://{host}:{port}/0"
+
+    async def start(self) -> "FakeRedis":
+        self._server = await asyncio.start_server(self._handle, "127.0.0.1", 0)
+        return self
+
+    async def stop(self) -> None:
+        if self._server is not None:
+            self._server.close()
+            await self._server.wait_closed()
+
+    async def _read_command(self, reader: asyncio.StreamReader) -> Optional[List[bytes]]:
+        line = await reader.readline()
+        if not line:
+            return None
+        if not line.startswith(b"*"):
+            return line.strip().split()
+        args = []
+        for _ in range(int(line[1:])):
+            size = int((await reader.readline())[1:])
+            args.append((await reader.readexactly(size + 2))[:-2])
+        return args
+
+    async def _handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        self.connections += 1
+        try:
+            while True:
+                args = await self._read_command(reader)
+                if args is None:
+                    break
+                self.commands += 1
+                cmd = args[0].upper() if args else b""
+                if cmd == b"PING":
+                    writer.write(b"+PONG\r\n")
+                elif cmd == b"HELLO":
+                    proto = int(args[1]) if len(args) > 1 else 2
+                    head = b"%1\r\n" if proto == 3 else b"*2\r\n"
+                    writer.write(head + b"$5\r\nproto\r\n:" + str(proto).encode() + b"\r\n")
+                else:
+                    writer.write(b"+OK\r\n")
+                await writer.drain()
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            writer.close()
+
+
+class FakeHttpDependency:
+    """Minimal HTTP/1.1 keep-alive server answering every GET with 200 and an empty JSON body."""
+
+    _RESPONSE = b"HTTP/1.1 200 OK\r\nContent-Type: application/json\r\nContent-Length: 2\r\n\r\n{}"
+
+    def __init__(self, *, delay_s: float = 0.0) -> None:
+        self._server: Optional[asyncio.AbstractServer] = None
+        self._delay_s = delay_s
+        self.connections = 0
+        self.requests = 0
+
+    @property
+    def url(self) -> str:
+        host, port = self._server.sockets[0].getsockname()[:2]  # type: ignore[union-attr]
+        return f"http://{host}:{port}/health"
+
+    async def start(self) -> "FakeHttpDependency":
+        self._server = await asyncio.start_server(self._handle, "127.0.0.1", 0)
+        return self
+
+    async def stop(self) -> None:
+        if self._server is not None:
+            self._server.close()
+            await self._server.wait_closed()
+
+    async def _handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        self.connections += 1
+        try:
+            while True:
+                head = await reader.readuntil(b"\r\n\r\n")
+                if not head:
+                    break
+                self.requests += 1
+                if self._delay_s:
+                    await asyncio.sleep(self._delay_s)
+                writer.write(self._RESPONSE)
+                await writer.drain()
+        except (ConnectionError, asyncio.IncompleteReadError, asyncio.LimitOverrunError):
+            pass
+        finally:
+            writer.close()
+
+
+def sqlite_engine():
+    from sqlalchemy import create_engine
+    from sqlalchemy.pool import StaticPool
+
+    # One shared in-memory connection usable from the probe threads.
+    return create_engine("sqlite://", poolclass=StaticPool, connect_args={"check_same_thread": False})
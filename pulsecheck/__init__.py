@@ -1,4 +1,13 @@
-from importlib.metadata import version
-
-__version__ = version("pulsecheck-py")
 __all__ = ["__version__"]
+
+
+def __getattr__(name: str):
+    # Resolved on first access: reading dist-info metadata is slow at import time.
+    if name == "__version__":
+        from importlib.metadata import version
+
+        value = version("pulsecheck-py")
+        globals()["__version__"] = value
+        return value
+
+    raise AttributeError(f"module {__name__} has no attribute {name}")
@@ -0,0 +1,288 @@
+"""
+Fleet-level readiness: probe many pulsecheck endpoints concurrently and roll the
+results up by service and environment.
+
+    pulsecheck-aggregate targets.txt --concurrency 100 --timeout 2 --stream
+    pulsecheck-aggregate targets.json --cache ~/.cache/pulsecheck.json --cache-ttl 30
+
+Targets are read from a file (or `-` for stdin), either a JSON list of
+`{"url": ..., "service": ..., "environment": ...}` objects or plain text with one
+`[service] url` per line. Requires the `http` extra.
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import os
+import sys
+import time
+from dataclasses import dataclass
+from typing import Any, AsyncIterator, Dict, Iterable, List, Optional, Sequence
+from urllib.parse import urlsplit
+
+from .core.checks.http_dep import HttpClientPool
+from .core.encoding import dumps, loads
+from .core.models import HealthStatus, OverallHealthResponse
+from .core.status import combine_status
+from .core.utils import now_ms
+
+
+@dataclass(frozen=True)
+class Target:
+    url: str
+    # Defaults to the URL host.
+    service: Optional[str] = None
+    # Defaults to the environment reported by the endpoint.
+    environment: Optional[str] = None
+
+    @property
+    def service_name(self) -> str:
+        return self.service or urlsplit(self.url).hostname or self.url
+
+
+@dataclass
+class TargetResult:
+    target: Target
+    status: HealthStatus
+    response: Optional[OverallHealthResponse] = None
+    error: Optional[str] = None
+    response_time_ms: Optional[float] = None
+    # True when served from the cache (fresh entry or HTTP 304).
+    cached: bool = False
+
+    @property
+    def environment(self) -> str:
+        if self.target.environment:
+            return self.target.environment
+        return self.response.environment if self.response is not None else "unknown"
+
+    def to_dict(self) -> Dict[str, Any]:
+        out: Dict[str, Any] = {
+            "url": self.target.url,
+            "service": self.target.service_name,
+            "environment": self.environment,
+            "status": self.status.value,
+        }
+        if self.response_time_ms is not None:
+            out["response_time_ms"] = self.response_time_ms
+        if self.error:
+            out["error"] = self.error
+        if self.cached:
+            out["cached"] = True
+        if self.response is not None:
+            failing = {name: r.to_dict() for name, r in self.response.checks.items() if r.status != HealthStatus.HEALTHY}
+            if failing:
+                out["checks"] = failing
+        return out
+
+
+def load_targets(lines: Iterable[str]) -> List[Target]:
+    text = "".join(lines)
+    if text.lstrip().startswith("["):
+        return [Target(url=t["url"], service=t.get("service"), environment=t.get("environment")) for t in json.loads(text)]
+    targets = []
+    for line in text.splitlines():
+        parts = line.split("#", 1)[0].split()
+        if not parts:
+            continue
+        targets.append(Target(url=parts[-1], service=parts[0] if len(parts) > 1 else None))
+    return targets
+
+
+class ResponseCache:
+    """
+    Last response body and ETag per URL, optionally persisted to a JSON file between runs.
+    Entries younger than `ttl_s` are reused without a request; older ones are revalidated
+    with `If-None-Match`.
+    """
+
+    def __init__(self, path: Optional[str] = None, *, ttl_s: float = 0.0) -> None:
+        self.path = path
+        self.ttl_s = ttl_s
+        # url -> {"etag", "body", "fetched_at"}
+        self._entries: Dict[str, Dict[str, Any]] = {}
+        if path and os.path.exists(path):
+            try:
+                with open(path, "rb") as f:
+                    self._entries = loads(f.read())
+            except (OSError, ValueError):
+                self._entries = {}
+
+    def fresh(self, url: str) -> Optional[Dict[str, Any]]:
+        entry = self._entries.get(url)
+        if entry is not None and time.time() - entry["fetched_at"] <= self.ttl_s:
+            return entry
+        return None
+
+    def etag(self, url: str) -> Optional[str]:
+        entry = self._entries.get(url)
+        return entry.get("etag") if entry else None
+
+    def body(self, url: str) -> Optional[Dict[str, Any]]:
+        entry = self._entries.get(url)
+        return entry["body"] if entry else None
+
+    def store(self, url: str, etag: Optional[str], body: Dict[str, Any]) -> None:
+        self._entries[url] = {"etag": etag, "body": body, "fetched_at": time.time()}
+
+    def touch(self, url: str) -> None:
+        self._entries[url]["fetched_at"] = time.time()
+
+    def save(self) -> None:
+        if not self.path:
+            return
+        tmp = f"{self.path}.{os.getpid()}.tmp"
+        with open(tmp, "wb") as f:
+            f.write(dumps(self._entries))
+        os.replace(tmp, self.path)
+
+
+class Aggregator:
+    """
+    Probes targets over one pooled client, at most `concurrency` at a time, each
+    within `timeout_s`. Unreachable targets and invalid payloads are UNHEALTHY.
+    """
+
+    def __init__(
+        self,
+        *,
+        concurrency: int = 50,
+        timeout_s: float = 3.0,
+        headers: Optional[Dict[str, str]] = None,
+        pool: Optional[HttpClientPool] = None,
+        cache: Optional[ResponseCache] = None,
+    ) -> None:
+        self._concurrency = concurrency
+        self._timeout_s = timeout_s
+        self._headers = headers or {}
+        self._owned_pool = pool is None
+        self._pool = pool or HttpClientPool(max_connections=concurrency, max_keepalive_connections=concurrency)
+        self.cache = cache
+
+    def _result(self, target: Target, body: Dict[str, Any], elapsed: Optional[float], cached: bool) -> TargetResult:
+        try:
+            res = OverallHealthResponse.from_dict(body)
+        except (KeyError, TypeError, ValueError) as e:
+            return TargetResult(target, HealthStatus.UNHEALTHY, error=f"Invalid response: {repr(e)}", response_time_ms=elapsed)
+        return TargetResult(target, res.status, response=res, response_time_ms=elapsed, cached=cached)
+
+    async def probe(self, target: Target) -> TargetResult:
+        url = target.url
+        cache = self.cache
+        if cache is not None and cache.fresh(url) is not None:
+            return self._result(target, cache.body(url), None, True)
+
+        headers = dict(self._headers)
+        etag = cache.etag(url) if cache is not None else None
+        if etag:
+            headers["If-None-Match"] = etag
+
+        start = time.perf_counter()
+        try:
+            resp = await asyncio.wait_for(self._pool.get().get(url, headers=headers, timeout=self._timeout_s), self._timeout_s)
+        except Exception as e:
+            return TargetResult(target, HealthStatus.UNHEALTHY, error=f"Request failed: {repr(e)}")
+        elapsed = now_ms(start)
+
+        if resp.status_code == 304 and cache is not None and cache.body(url) is not None:
+            cache.touch(url)
+            return self._result(target, cache.body(url), elapsed, True)
+        try:
+            body = loads(resp.content)
+        except ValueError:
+            return TargetResult(target, HealthStatus.UNHEALTHY, error=f"HTTP {resp.status_code}: body is not JSON", response_time_ms=elapsed)
+        result = self._result(target, body, elapsed, False)
+        if cache is not None and result.response is not None:
+            cache.store(url, resp.headers.get("etag"), body)
+        return result
+
+    async def stream(self, targets: Sequence[Target]) -> AsyncIterator[TargetResult]:
+        """Yield results in completion order."""
+        sem = asyncio.Semaphore(self._concurrency)
+
+        async def _bounded(t: Target) -> TargetResult:
+            async with sem:
+                return await self.probe(t)
+
+        tasks = [asyncio.create_task(_bounded(t)) for t in targets]
+        try:
+            for fut in asyncio.as_completed(tasks):
+                yield await fut
+        finally:
+            for task in tasks:
+                task.cancel()
+
+    async def run(self, targets: Sequence[Target]) -> List[TargetResult]:
+        return [r async for r in self.stream(targets)]
+
+    async def aclose(self) -> None:
+        if self._owned_pool:
+            await self._pool.aclose()
+
+
+def rollup(results: Iterable[TargetResult]) -> Dict[str, Any]:
+    """Overall status, plus status and target counts per service and environment."""
+    overall = HealthStatus.HEALTHY
+    services: Dict[str, Dict[str, Dict[str, Any]]] = {}
+    counts = {s.value: 0 for s in HealthStatus}
+    for r in results:
+        overall = combine_status(overall, r.status)
+        counts[r.status.value] += 1
+        group = services.setdefault(r.target.service_name, {}).setdefault(
+            r.environment, {"status": HealthStatus.HEALTHY.value, "targets": 0, "unhealthy": []}
+        )
+        group["status"] = combine_status(HealthStatus(group["status"]), r.status).value
+        group["targets"] += 1
+        if r.status == HealthStatus.UNHEALTHY:
+            group["unhealthy"].append(r.target.url)
+    if not services:
+        overall = HealthStatus.UNHEALTHY
+    return {"status": overall.value, "targets": sum(counts.values()), "counts": counts, "services": services}
+
+
+async def _main(args: argparse.Namespace) -> int:
+    if args.targets == "-":
+        targets = load_targets(sys.stdin)
+    else:
+        with open(args.targets) as f:
+            targets = load_targets(f)
+
+    cache = ResponseCache(args.cache, ttl_s=args.cache_ttl) if args.cache else None
+    aggregator = Aggregator(concurrency=args.concurrency, timeout_s=args.timeout, cache=cache)
+    results: List[TargetResult] = []
+    out = sys.stdout
+    try:
+        async for r in aggregator.stream(targets):
+            results.append(r)
+            if args.stream:
+                out.write(dumps(r.to_dict()).decode() + "\n")
+                out.flush()
+    finally:
+        await aggregator.aclose()
+        if cache is not None:
+            cache.save()
+
+    summary = rollup(results)
+    if not args.stream:
+        summary["results"] = [r.to_dict() for r in sorted(results, key=lambda r: (r.target.service_name, r.target.url))]
+    out.write(dumps({"summary": summary} if args.stream else summary).decode() + "\n")
+
+    fail = {HealthStatus.UNHEALTHY} if args.fail_on == "unhealthy" else {HealthStatus.UNHEALTHY, HealthStatus.DEGRADED}
+    return 1 if HealthStatus(summary["status"]) in fail else 0
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(prog="pulsecheck-aggregate", description="Probe many pulsecheck readiness endpoints and roll them up.")
+    parser.add_argument("targets", help="target file (JSON list or '[service] url' lines), or - for stdin")
+    parser.add_argument("--concurrency", type=int, default=50)
+    parser.add_argument("--timeout", type=float, default=3.0, help="per-target deadline in seconds")
+    parser.add_argument("--stream", action="store_true", help="print one JSON line per target as it completes, then the summary")
+    parser.add_argument("--cache", help="JSON file keeping bodies and ETags between runs")
+    parser.add_argument("--cache-ttl", type=float, default=0.0, help="reuse cached results younger than this many seconds without a request")
+    parser.add_argument("--fail-on", choices=("unhealthy", "degraded"), default="unhealthy", help="exit 1 when the overall status is this bad")
+    return asyncio.run(_main(parser.parse_args(argv)))
+
+
+if __name__ == "__main__":
+    sys.exit(main())
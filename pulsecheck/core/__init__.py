@@ -1,5 +1,11 @@
 from .registry import HealthRegistry
+from .metrics import render_prometheus
 from .models import HealthStatus, HealthCheckResult, OverallHealthResponse
+from .breaker import BreakerState, CircuitBreaker
+from .executor import CheckExecutor, ExecutorSaturated
+from .passive import PassiveWindow, instrument_redis, instrument_sqlalchemy
+from .scheduler import SchedulerConfig
+from .shared import SharedSnapshotConfig
 from .status import http_status_from_health
 
 __all__ = [
@@ -7,5 +13,15 @@ __all__ = [
     "HealthStatus",
     "HealthCheckResult",
     "OverallHealthResponse",
+    "SchedulerConfig",
+    "SharedSnapshotConfig",
+    "CheckExecutor",
+    "CircuitBreaker",
+    "BreakerState",
+    "ExecutorSaturated",
     "http_status_from_health",
+    "render_prometheus",
+    "PassiveWindow",
+    "instrument_sqlalchemy",
+    "instrument_redis",
 ]
@@ -0,0 +1,72 @@
+from __future__ import annotations
+
+import time
+from enum import Enum
+from typing import Optional
+
+from .models import HealthCheckResult, HealthStatus
+
+
+class BreakerState(str, Enum):
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+
+class CircuitBreaker:
+    """
+    Stops probing a failing dependency for a while.
+
+    After `threshold` consecutive UNHEALTHY results the circuit opens and the last
+    failure is served without probing. Once the backoff expires a single trial
+    probe is let through (half-open): success closes the circuit, failure reopens
+    it with the backoff doubled, up to `max_backoff_s`.
+    """
+
+    def __init__(self, *, threshold: int, backoff_s: float = 5.0, max_backoff_s: float = 60.0) -> None:
+        self.threshold = threshold
+        self.backoff_s = backoff_s
+        self.max_backoff_s = max_backoff_s
+        self.state = BreakerState.CLOSED
+        self._failures = 0
+        self._current_backoff = backoff_s
+        self._retry_at = 0.0
+        self._last_failure: Optional[HealthCheckResult] = None
+
+    def allow(self) -> bool:
+        if self.state == BreakerState.CLOSED:
+            return True
+        if self.state == BreakerState.OPEN and time.monotonic() >= self._retry_at:
+            self.state = BreakerState.HALF_OPEN
+            return True
+        return False
+
+    def record(self, res: Optional[HealthCheckResult]) -> None:
+        """Record a probe outcome; `None` means the probe never finished."""
+        if res is not None and res.status != HealthStatus.UNHEALTHY:
+            self.state = BreakerState.CLOSED
+            self._failures = 0
+            self._current_backoff = self.backoff_s
+            return
+
+        if res is not None:
+            self._last_failure = res
+        if self.state == BreakerState.HALF_OPEN:
+            self._current_backoff = min(self._current_backoff * 2, self.max_backoff_s)
+            self._open()
+            return
+        self._failures += 1
+        if self._failures >= self.threshold:
+            self._open()
+
+    def _open(self) -> None:
+        self.state = BreakerState.OPEN
+        self._retry_at = time.monotonic() + self._current_backoff
+
+    def open_result(self) -> HealthCheckResult:
+        last = self._last_failure
+        return HealthCheckResult(
+            status=HealthStatus.UNHEALTHY,
+            error=last.error if last is not None else "Circuit open",
+            meta={"circuit": self.state.value},
+        )
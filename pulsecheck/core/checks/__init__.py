@@ -1,5 +1,6 @@
 from typing import TYPE_CHECKING
 from .base import HealthCheck, CheckConfig
+from .liveness import LivenessCheck, EventLoopLagCheck, ExecutorSaturationCheck, ResourceCheck, GCPauseCheck
 
 if TYPE_CHECKING:
     from .sqlalchemy_async import SQLAlchemyAsyncCheck
@@ -7,21 +8,33 @@ if TYPE_CHECKING:
     from .django_db import DjangoDBCheck
     from .redis_async import RedisAsyncCheck
     from .redis_sync import RedisSyncCheck
+    from .redis_cluster import RedisClusterCheck
     from .rabbitmq_kombu import RabbitMQKombuCheck
     from .celery_inspect import CeleryInspectCheck
-    from .http_dep import HttpDependencyCheck
+    from .celery_events import CeleryEventsCheck
+    from .http_dep import HttpDependencyCheck, HttpMultiTargetCheck, HttpClientPool, PassiveTransport
 
 __all__ = [
     "HealthCheck",
     "CheckConfig",
+    "LivenessCheck",
+    "EventLoopLagCheck",
+    "ExecutorSaturationCheck",
+    "ResourceCheck",
+    "GCPauseCheck",
     "SQLAlchemyAsyncCheck",
     "SQLAlchemySyncCheck",
     "DjangoDBCheck",
     "RedisAsyncCheck",
     "RedisSyncCheck",
+    "RedisClusterCheck",
     "RabbitMQKombuCheck",
     "CeleryInspectCheck",
+    "CeleryEventsCheck",
     "HttpDependencyCheck",
+    "HttpMultiTargetCheck",
+    "HttpClientPool",
+    "PassiveTransport",
 ]
 
 
@@ -46,6 +59,10 @@ def __getattr__(name: str):
         from .redis_sync import RedisSyncCheck
         return RedisSyncCheck
 
+    if name == "RedisClusterCheck":
+        from .redis_cluster import RedisClusterCheck
+        return RedisClusterCheck
+
     if name == "RabbitMQKombuCheck":
         from .rabbitmq_kombu import RabbitMQKombuCheck
         return RabbitMQKombuCheck
@@ -54,8 +71,24 @@ def __getattr__(name: str):
         from .celery_inspect import CeleryInspectCheck
         return CeleryInspectCheck
 
+    if name == "CeleryEventsCheck":
+        from .celery_events import CeleryEventsCheck
+        return CeleryEventsCheck
+
     if name == "HttpDependencyCheck":
         from .http_dep import HttpDependencyCheck
         return HttpDependencyCheck
 
+    if name == "HttpMultiTargetCheck":
+        from .http_dep import HttpMultiTargetCheck
+        return HttpMultiTargetCheck
+
+    if name == "HttpClientPool":
+        from .http_dep import HttpClientPool
+        return HttpClientPool
+
+    if name == "PassiveTransport":
+        from .http_dep import PassiveTransport
+        return PassiveTransport
+
     raise AttributeError(f"module {__name__} has no attribute {name}")
\ No newline at end of file
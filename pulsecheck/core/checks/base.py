@@ -1,9 +1,11 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import Optional
+from typing import Optional, Tuple
 
+from ..breaker import CircuitBreaker
 from ..models import HealthCheckResult
+from ..passive import PassiveWindow
 
 
 @dataclass
@@ -12,6 +14,14 @@ class CheckConfig:
     readiness: bool = True
     timeout_s: float = 2.0
     degrade_threshold_ms: Optional[float] = None
+    # Scheduler mode: probe interval for this check, overriding SchedulerConfig.interval_s.
+    interval_s: Optional[float] = None
+    # Circuit breaker: open after this many consecutive failures (None disables it).
+    breaker_threshold: Optional[int] = None
+    breaker_backoff_s: float = 5.0
+    breaker_max_backoff_s: float = 60.0
+    # Groups this check belongs to; each is served at /ready/<tag>.
+    tags: Tuple[str, ...] = ()
 
 
 class HealthCheck:
@@ -24,6 +34,30 @@ class HealthCheck:
 
     def __init__(self, config: CheckConfig) -> None:
         self.config = config
+        self._breaker: Optional[CircuitBreaker] = None
+        # Outcomes from real traffic; when conclusive they stand in for the active probe.
+        self.passive: Optional[PassiveWindow] = None
+
+    @property
+    def breaker(self) -> Optional[CircuitBreaker]:
+        if self.config.breaker_threshold is None:
+            return None
+        if self._breaker is None:
+            self._breaker = CircuitBreaker(
+                threshold=self.config.breaker_threshold,
+                backoff_s=self.config.breaker_backoff_s,
+                max_backoff_s=self.config.breaker_max_backoff_s,
+            )
+        return self._breaker
+
+    def passive_result(self) -> Optional[HealthCheckResult]:
+        if self.passive is None:
+            return None
+        return self.passive.verdict(self.config.degrade_threshold_ms)
 
     async def check(self) -> HealthCheckResult:
         raise NotImplementedError
+
+    async def aclose(self) -> None:
+        """Release connections or clients kept between probes."""
+        return None
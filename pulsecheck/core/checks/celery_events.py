@@ -0,0 +1,174 @@
+from __future__ import annotations
+
+import queue
+import threading
+import time
+from typing import Any, Dict, List, Optional, Sequence
+
+from celery import Celery  # type: ignore
+from celery.events.state import State  # type: ignore
+
+from ..models import HealthCheckResult, HealthStatus
+from ..utils import now_ms
+from .base import CheckConfig, HealthCheck
+
+_WORKER_EVENTS = ("worker-online", "worker-heartbeat", "worker-offline")
+
+
+class CeleryEventsCheck(HealthCheck):
+    """
+    Tracks workers from their `worker-*` events on a background consumer thread and
+    answers readiness from memory, without a broadcast `inspect().ping()` per probe.
+
+    Queues are looked up once per newly seen worker (`active_queues`, addressed to the
+    new workers only) on a separate thread, so lookups never hold up event draining.
+    For `warmup_s` after start (one worker heartbeat interval by default) a shortfall
+    of live workers is reported DEGRADED rather than UNHEALTHY, since workers only
+    show up once their first heartbeat arrives.
+    """
+
+    def __init__(
+        self,
+        celery_app: Celery,
+        *,
+        name: str = "celery",
+        min_workers: int = 1,
+        queues: Sequence[str] = (),
+        track_queues: bool = True,
+        reconnect_backoff_s: float = 1.0,
+        max_reconnect_backoff_s: float = 30.0,
+        warmup_s: float = 2.0,
+    ) -> None:
+        super().__init__(CheckConfig(name=name, readiness=True))
+        self._celery = celery_app
+        self._min_workers = min_workers
+        # Queues that must have at least one live worker.
+        self._queues = tuple(queues)
+        self._track_queues = track_queues or bool(queues)
+        self._backoff_s = reconnect_backoff_s
+        self._max_backoff_s = max_reconnect_backoff_s
+        self._warmup_s = warmup_s
+        self._started_at: Optional[float] = None
+        self._state = State()
+        # hostname -> queue names it consumes (None while the lookup is in flight)
+        self._worker_queues: Dict[str, Optional[List[str]]] = {}
+        self._lock = threading.Lock()
+        self._thread: Optional[threading.Thread] = None
+        # hostnames awaiting a queue lookup; None stops the lookup thread
+        self._lookups: "queue.Queue[Optional[str]]" = queue.Queue()
+        self._lookup_thread: Optional[threading.Thread] = None
+        self._receiver: Any = None
+        self._stopping = threading.Event()
+        self._connected = False
+        self._last_error: Optional[BaseException] = None
+
+    def _on_event(self, event: Dict[str, Any]) -> None:
+        hostname = event.get("hostname")
+        with self._lock:
+            self._state.event(event)
+            if event.get("type") == "worker-offline":
+                self._worker_queues.pop(hostname, None)
+                return
+            if self._track_queues and hostname is not None and hostname not in self._worker_queues:
+                self._worker_queues[hostname] = None
+                self._lookups.put(hostname)
+
+    def _lookup_queues(self) -> None:
+        while True:
+            hostname = self._lookups.get()
+            if hostname is None:
+                return
+            # One request for every worker that showed up meanwhile.
+            batch = [hostname]
+            while True:
+                try:
+                    hostname = self._lookups.get_nowait()
+                except queue.Empty:
+                    break
+                if hostname is None:
+                    return
+                batch.append(hostname)
+            try:
+                replies = self._celery.control.inspect(destination=batch, timeout=1.0).active_queues() or {}
+            except Exception:
+                replies = {}
+            with self._lock:
+                for hostname in batch:
+                    if hostname not in replies:
+                        # Retried on the worker's next heartbeat.
+                        self._worker_queues.pop(hostname, None)
+                    elif hostname in self._worker_queues:
+                        self._worker_queues[hostname] = [q["name"] for q in replies[hostname]]
+
+    def _consume(self) -> None:
+        backoff = self._backoff_s
+        handlers = {kind: self._on_event for kind in _WORKER_EVENTS}
+        while not self._stopping.is_set():
+            try:
+                with self._celery.connection_for_read() as conn:
+                    conn.ensure_connection(max_retries=1)
+                    self._receiver = self._celery.events.Receiver(conn, handlers=handlers)
+                    self._connected, self._last_error = True, None
+                    backoff = self._backoff_s
+                    # wakeup=True asks every worker for an immediate heartbeat.
+                    self._receiver.capture(limit=None, timeout=None, wakeup=True)
+            except Exception as e:
+                self._last_error = e
+            finally:
+                self._connected = False
+                self._receiver = None
+            self._stopping.wait(backoff)
+            backoff = min(backoff * 2, self._max_backoff_s)
+
+    def start(self) -> None:
+        """Start the event consumer thread; also started by the first probe."""
+        if self._thread is not None:
+            return
+        self._stopping.clear()
+        self._started_at = time.monotonic()
+        self._thread = threading.Thread(target=self._consume, name=f"pulsecheck-{self.config.name}", daemon=True)
+        self._thread.start()
+        if self._track_queues:
+            self._lookup_thread = threading.Thread(target=self._lookup_queues, name=f"pulsecheck-{self.config.name}-queues", daemon=True)
+            self._lookup_thread.start()
+
+    async def aclose(self) -> None:
+        thread, self._thread = self._thread, None
+        if thread is None:
+            return
+        self._stopping.set()
+        if self._lookup_thread is not None:
+            self._lookups.put(None)
+            self._lookup_thread = None
+        receiver = self._receiver
+        if receiver is not None:
+            receiver.should_stop = True
+
+    async def check(self) -> HealthCheckResult:
+        start = time.perf_counter()
+        self.start()
+
+        with self._lock:
+            alive = [w.hostname for w in self._state.workers.values() if w.alive]
+            per_queue: Dict[str, int] = {}
+            for hostname in alive:
+                for q in self._worker_queues.get(hostname) or ():
+                    per_queue[q] = per_queue.get(q, 0) + 1
+            queues_known = all(self._worker_queues.get(h) is not None for h in alive)
+
+        meta: Dict[str, Any] = {"workers": len(alive)}
+        if self._track_queues:
+            meta["queues"] = per_queue
+        elapsed = now_ms(start)
+
+        if not self._connected and self._last_error is not None:
+            return HealthCheckResult(status=HealthStatus.UNHEALTHY, error=f"Celery failed: event consumer disconnected: {repr(self._last_error)}", meta=meta)
+        if len(alive) < self._min_workers:
+            if self._started_at is not None and time.monotonic() - self._started_at < self._warmup_s:
+                return HealthCheckResult(status=HealthStatus.DEGRADED, response_time_ms=elapsed, error=f"Celery: waiting for worker heartbeats ({len(alive)} live so far)", meta=meta)
+            return HealthCheckResult(status=HealthStatus.UNHEALTHY, response_time_ms=elapsed, error=f"Celery failed: {len(alive)} live worker(s), need {self._min_workers}", meta=meta)
+        # Queue lookups for new workers may still be in flight; only judge queues once they are known.
+        idle = [q for q in self._queues if not per_queue.get(q)]
+        if idle and queues_known:
+            return HealthCheckResult(status=HealthStatus.UNHEALTHY, response_time_ms=elapsed, error=f"Celery failed: no live workers consuming {', '.join(idle)}", meta=meta)
+        return HealthCheckResult(status=HealthStatus.HEALTHY, response_time_ms=elapsed, meta=meta)
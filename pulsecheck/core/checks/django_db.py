@@ -16,6 +16,9 @@ class DjangoDBCheck(HealthCheck):
         start = time.perf_counter()
 
         def _sync() -> None:
+            # Probe threads are long-lived and keep their own connection; drop it once
+            # broken or past CONN_MAX_AGE, as Django does at the end of each request.
+            connection.close_if_unusable_or_obsolete()
             with connection.cursor() as cursor:
                 cursor.execute("SELECT 1")
                 cursor.fetchone()
@@ -1,15 +1,117 @@
 from __future__ import annotations
 
+import asyncio
 import time
-from typing import Optional
+from typing import Any, Dict, Mapping, Optional, Sequence, Union
 
 import httpx  # type: ignore
 
 from ..models import HealthCheckResult, HealthStatus
+from ..passive import PassiveWindow
+from ..status import combine_status
 from ..utils import now_ms, with_timeout
 from .base import CheckConfig, HealthCheck
 
 
+class HttpClientPool:
+    """
+    One keep-alive `httpx.AsyncClient` shared by HTTP checks, created lazily.
+    Set `http2=True` to negotiate HTTP/2 (requires `httpx[http2]`).
+    """
+
+    def __init__(
+        self,
+        *,
+        http2: bool = False,
+        max_connections: int = 100,
+        max_keepalive_connections: int = 20,
+        keepalive_expiry: float = 30.0,
+        **client_kwargs: Any,
+    ) -> None:
+        self._http2 = http2
+        self._limits = httpx.Limits(
+            max_connections=max_connections,
+            max_keepalive_connections=max_keepalive_connections,
+            keepalive_expiry=keepalive_expiry,
+        )
+        self._client_kwargs = client_kwargs
+        self._client: Optional[httpx.AsyncClient] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+
+    def get(self) -> httpx.AsyncClient:
+        loop = asyncio.get_running_loop()
+        if self._client is not None and self._loop is not loop:
+            # Pooled connections are bound to the loop that opened them.
+            self._release(self._client, self._loop)
+            self._client = None
+        if self._client is None:
+            self._client = httpx.AsyncClient(http2=self._http2, limits=self._limits, **self._client_kwargs)
+            self._loop = loop
+        return self._client
+
+    @staticmethod
+    def _release(client: httpx.AsyncClient, loop: Optional[asyncio.AbstractEventLoop]) -> None:
+        # Close on the loop the client belongs to, if it still runs; a closed loop took
+        # its transports with it and the client is just dropped.
+        if loop is not None and loop.is_running() and not loop.is_closed():
+            asyncio.run_coroutine_threadsafe(client.aclose(), loop)
+
+    async def aclose(self) -> None:
+        client, self._client = self._client, None
+        if client is None:
+            return
+        if self._loop is asyncio.get_running_loop():
+            await client.aclose()
+        else:
+            self._release(client, self._loop)
+
+
+class PassiveTransport(httpx.AsyncBaseTransport):
+    """
+    httpx transport wrapper that records the outcome of real application requests per host.
+    Transport errors and 5xx responses count as failures.
+
+        transport = PassiveTransport()
+        app_client = httpx.AsyncClient(transport=transport)
+        HttpDependencyCheck(url, name="billing", passive=transport.window("billing.internal"))
+    """
+
+    def __init__(self, transport: Optional[httpx.AsyncBaseTransport] = None, **window_kwargs: Any) -> None:
+        self._transport = transport or httpx.AsyncHTTPTransport()
+        self._window_kwargs = window_kwargs
+        self._windows: Dict[str, PassiveWindow] = {}
+
+    def window(self, host: str) -> PassiveWindow:
+        w = self._windows.get(host)
+        if w is None:
+            w = self._windows[host] = PassiveWindow(**self._window_kwargs)
+        return w
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        start = time.perf_counter()
+        window = self.window(request.url.host)
+        try:
+            response = await self._transport.handle_async_request(request)
+        except Exception:
+            window.record(False, now_ms(start))
+            raise
+        window.record(response.status_code < 500, now_ms(start))
+        return response
+
+    async def aclose(self) -> None:
+        await self._transport.aclose()
+
+
+_default_pool: Optional[HttpClientPool] = None
+
+
+def default_http_pool() -> HttpClientPool:
+    global _default_pool
+    if _default_pool is None:
+        _default_pool = HttpClientPool()
+    return _default_pool
+
+
 class HttpDependencyCheck(HealthCheck):
     def __init__(
         self,
@@ -20,26 +122,83 @@ class HttpDependencyCheck(HealthCheck):
         degrade_threshold_ms: float = 500.0,
         expected_status: int = 200,
         headers: Optional[dict] = None,
+        pool: Optional[HttpClientPool] = None,
+        passive: Optional[PassiveWindow] = None,
     ) -> None:
         super().__init__(CheckConfig(name=name, readiness=True, timeout_s=timeout_s, degrade_threshold_ms=degrade_threshold_ms))
+        self.passive = passive
         self._url = url
         self._expected = expected_status
         self._headers = headers or {}
+        self._pool = pool or default_http_pool()
+
+    async def check(self) -> HealthCheckResult:
+        passive = self.passive_result()
+        if passive is not None:
+            return passive
+        return await _probe_url(self._pool, self._url, self._headers, self._expected, self.config)
+
+    async def aclose(self) -> None:
+        await self._pool.aclose()
+
+
+class HttpMultiTargetCheck(HealthCheck):
+    """
+    Probes many URLs concurrently through one pool and reports each target in `meta["targets"]`.
+    The check status is the worst target status.
+    """
+
+    def __init__(
+        self,
+        targets: Union[Sequence[str], Mapping[str, str]],
+        *,
+        name: str,
+        timeout_s: float = 2.0,
+        degrade_threshold_ms: float = 500.0,
+        expected_status: int = 200,
+        headers: Optional[dict] = None,
+        pool: Optional[HttpClientPool] = None,
+    ) -> None:
+        super().__init__(CheckConfig(name=name, readiness=True, timeout_s=timeout_s, degrade_threshold_ms=degrade_threshold_ms))
+        # target name -> url
+        self._targets: Dict[str, str] = dict(targets) if isinstance(targets, Mapping) else {u: u for u in targets}
+        self._expected = expected_status
+        self._headers = headers or {}
+        self._pool = pool or default_http_pool()
 
     async def check(self) -> HealthCheckResult:
         start = time.perf_counter()
+        results = await asyncio.gather(
+            *(_probe_url(self._pool, url, self._headers, self._expected, self.config) for url in self._targets.values())
+        )
 
-        async def _run() -> int:
-            async with httpx.AsyncClient(timeout=self.config.timeout_s, headers=self._headers) as client:
-                resp = await client.get(self._url)
-                return resp.status_code
+        overall = HealthStatus.HEALTHY
+        per_target: Dict[str, Dict[str, Any]] = {}
+        for target, res in zip(self._targets, results):
+            overall = combine_status(overall, res.status)
+            per_target[target] = res.to_dict()
 
-        try:
-            code = await with_timeout(_run(), self.config.timeout_s + 0.5)
-            elapsed = now_ms(start)
-            if code != self._expected:
-                return HealthCheckResult(status=HealthStatus.UNHEALTHY, response_time_ms=elapsed, error=f"HTTP {code} (expected {self._expected})")
-            status = HealthStatus.DEGRADED if (self.config.degrade_threshold_ms and elapsed > self.config.degrade_threshold_ms) else HealthStatus.HEALTHY
-            return HealthCheckResult(status=status, response_time_ms=elapsed)
-        except Exception as e:
-            return HealthCheckResult(status=HealthStatus.UNHEALTHY, error=f"HTTP dep failed: {repr(e)}")
+        failed = [t for t, res in zip(self._targets, results) if res.status == HealthStatus.UNHEALTHY]
+        error = f"{len(failed)}/{len(results)} targets failed: {', '.join(failed)}" if failed else None
+        return HealthCheckResult(status=overall, response_time_ms=now_ms(start), error=error, meta={"targets": per_target})
+
+    async def aclose(self) -> None:
+        await self._pool.aclose()
+
+
+async def _probe_url(pool: HttpClientPool, url: str, headers: dict, expected: int, config: CheckConfig) -> HealthCheckResult:
+    start = time.perf_counter()
+
+    async def _run() -> int:
+        resp = await pool.get().get(url, headers=headers, timeout=config.timeout_s)
+        return resp.status_code
+
+    try:
+        code = await with_timeout(_run(), config.timeout_s + 0.5)
+        elapsed = now_ms(start)
+        if code != expected:
+            return HealthCheckResult(status=HealthStatus.UNHEALTHY, response_time_ms=elapsed, error=f"HTTP {code} (expected {expected})")
+        status = HealthStatus.DEGRADED if (config.degrade_threshold_ms and elapsed > config.degrade_threshold_ms) else HealthStatus.HEALTHY
+        return HealthCheckResult(status=status, response_time_ms=elapsed)
+    except Exception as e:
+        return HealthCheckResult(status=HealthStatus.UNHEALTHY, error=f"HTTP dep failed: {repr(e)}")
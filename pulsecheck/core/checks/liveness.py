@@ -0,0 +1,223 @@
+from __future__ import annotations
+
+import asyncio
+import gc
+import os
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Deque, Dict, Optional, Tuple
+
+from ..models import HealthCheckResult, HealthStatus
+from ..status import combine_status
+
+
+def _grade(value: float, degraded: Optional[float], unhealthy: Optional[float]) -> HealthStatus:
+    if unhealthy is not None and value >= unhealthy:
+        return HealthStatus.UNHEALTHY
+    if degraded is not None and value >= degraded:
+        return HealthStatus.DEGRADED
+    return HealthStatus.HEALTHY
+
+
+class LivenessCheck:
+    """
+    In-process signal evaluated on every liveness request. `evaluate()` must only
+    read state collected in the background; it never contacts a dependency.
+    """
+
+    def __init__(self, name: str) -> None:
+        self.name = name
+
+    def evaluate(self) -> HealthCheckResult:
+        raise NotImplementedError
+
+
+class EventLoopLagCheck(LivenessCheck):
+    """
+    Samples how late the event loop wakes up from a `sleep(interval_s)`. The sampler
+    starts on the first evaluation inside a running loop; evaluated outside one (WSGI,
+    Django) there is no loop to measure and the result says it is not sampling.
+    """
+
+    def __init__(self, *, name: str = "event_loop", interval_s: float = 0.5, degraded_ms: float = 100.0, unhealthy_ms: float = 1000.0) -> None:
+        super().__init__(name)
+        self.interval_s = interval_s
+        self.degraded_ms = degraded_ms
+        self.unhealthy_ms = unhealthy_ms
+        self._task: Optional[asyncio.Task] = None
+        self._lag_ms = 0.0
+        self._next_tick: Optional[float] = None
+
+    async def _sample(self) -> None:
+        while True:
+            self._next_tick = time.perf_counter() + self.interval_s
+            await asyncio.sleep(self.interval_s)
+            self._lag_ms = max(0.0, (time.perf_counter() - self._next_tick) * 1000.0)
+
+    def _ensure_started(self) -> None:
+        if self._task is not None and not self._task.done():
+            return
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            return
+        self._task = loop.create_task(self._sample())
+
+    def close(self) -> None:
+        task, self._task = self._task, None
+        self._next_tick = None
+        if task is not None:
+            task.get_loop().call_soon_threadsafe(task.cancel)
+
+    def evaluate(self) -> HealthCheckResult:
+        self._ensure_started()
+        if self._next_tick is None:
+            return HealthCheckResult(status=HealthStatus.HEALTHY, meta={"lag_ms": "not sampling"})
+        # A sampler that has not woken up yet is at least this late.
+        lag = max(self._lag_ms, (time.perf_counter() - self._next_tick) * 1000.0)
+        return HealthCheckResult(
+            status=_grade(lag, self.degraded_ms, self.unhealthy_ms),
+            meta={"lag_ms": round(lag, 1)},
+        )
+
+
+class ExecutorSaturationCheck(LivenessCheck):
+    """Queue depth of a thread pool; defaults to the running loop's default executor."""
+
+    def __init__(
+        self,
+        executor: Optional[ThreadPoolExecutor] = None,
+        *,
+        name: str = "executor",
+        degraded_queue: int = 10,
+        unhealthy_queue: int = 100,
+    ) -> None:
+        super().__init__(name)
+        self._executor = executor
+        self.degraded_queue = degraded_queue
+        self.unhealthy_queue = unhealthy_queue
+
+    def evaluate(self) -> HealthCheckResult:
+        executor: Any = self._executor
+        if executor is None:
+            try:
+                loop: Any = asyncio.get_running_loop()
+            except RuntimeError:
+                loop = None
+            # asyncio's base loop creates its default executor lazily in `_default_executor`;
+            # other loop implementations may not expose it at all.
+            if hasattr(loop, "_default_executor") and loop._default_executor is None:
+                return HealthCheckResult(status=HealthStatus.HEALTHY, meta={"queued": 0})
+            executor = getattr(loop, "_default_executor", None)
+        # The work queue is a ThreadPoolExecutor internal as well.
+        qsize = getattr(getattr(executor, "_work_queue", None), "qsize", None)
+        if qsize is None:
+            return HealthCheckResult(status=HealthStatus.HEALTHY, meta={"queued": "unknown"})
+        depth = qsize()
+        return HealthCheckResult(
+            status=_grade(depth, self.degraded_queue, self.unhealthy_queue),
+            meta={"queued": depth, "max_workers": getattr(executor, "_max_workers", None)},
+        )
+
+
+class ResourceCheck(LivenessCheck):
+    """
+    Resident memory and open file descriptors, read from /proc (Linux) and cached
+    for `cache_s`. `max_open_fds` defaults to the process soft limit.
+    """
+
+    def __init__(
+        self,
+        *,
+        name: str = "resources",
+        max_rss_mb: Optional[float] = None,
+        max_open_fds: Optional[int] = None,
+        degraded_ratio: float = 0.9,
+        cache_s: float = 1.0,
+    ) -> None:
+        super().__init__(name)
+        self.max_rss_mb = max_rss_mb
+        self.max_open_fds = max_open_fds if max_open_fds is not None else self._fd_limit()
+        self.degraded_ratio = degraded_ratio
+        self.cache_s = cache_s
+        self._cached: Optional[Tuple[float, HealthCheckResult]] = None
+
+    @staticmethod
+    def _fd_limit() -> Optional[int]:
+        try:
+            import resource
+
+            soft, _ = resource.getrlimit(resource.RLIMIT_NOFILE)
+            return soft if soft > 0 else None
+        except (ImportError, ValueError, OSError):
+            return None
+
+    @staticmethod
+    def _rss_mb() -> Optional[float]:
+        try:
+            with open("/proc/self/statm") as f:
+                pages = int(f.read().split()[1])
+            return pages * os.sysconf("SC_PAGE_SIZE") / (1024 * 1024)
+        except (OSError, ValueError, IndexError):
+            return None
+
+    @staticmethod
+    def _open_fds() -> Optional[int]:
+        try:
+            return len(os.listdir("/proc/self/fd"))
+        except OSError:
+            return None
+
+    def _measure(self) -> HealthCheckResult:
+        status = HealthStatus.HEALTHY
+        meta: Dict[str, Any] = {}
+        for key, value, limit in (
+            ("rss_mb", self._rss_mb(), self.max_rss_mb),
+            ("open_fds", self._open_fds(), self.max_open_fds),
+        ):
+            if value is None:
+                continue
+            meta[key] = round(value, 1) if isinstance(value, float) else value
+            if limit:
+                status = combine_status(status, _grade(value, limit * self.degraded_ratio, limit))
+        return HealthCheckResult(status=status, meta=meta)
+
+    def evaluate(self) -> HealthCheckResult:
+        now = time.monotonic()
+        if self._cached is None or now - self._cached[0] > self.cache_s:
+            self._cached = (now, self._measure())
+        return self._cached[1]
+
+
+class GCPauseCheck(LivenessCheck):
+    """Longest garbage-collector pause within the last `window_s`, timed through `gc.callbacks`."""
+
+    def __init__(self, *, name: str = "gc", window_s: float = 60.0, degraded_ms: float = 100.0, unhealthy_ms: float = 1000.0) -> None:
+        super().__init__(name)
+        self.window_s = window_s
+        self.degraded_ms = degraded_ms
+        self.unhealthy_ms = unhealthy_ms
+        # (monotonic end time, pause ms)
+        self._pauses: Deque[Tuple[float, float]] = deque(maxlen=1024)
+        self._started: Optional[float] = None
+        gc.callbacks.append(self._on_gc)
+
+    def _on_gc(self, phase: str, info: Dict[str, Any]) -> None:
+        if phase == "start":
+            self._started = time.perf_counter()
+        elif self._started is not None:
+            self._pauses.append((time.monotonic(), (time.perf_counter() - self._started) * 1000.0))
+            self._started = None
+
+    def close(self) -> None:
+        if self._on_gc in gc.callbacks:
+            gc.callbacks.remove(self._on_gc)
+
+    def evaluate(self) -> HealthCheckResult:
+        cutoff = time.monotonic() - self.window_s
+        worst = max((ms for ended, ms in list(self._pauses) if ended >= cutoff), default=0.0)
+        return HealthCheckResult(
+            status=_grade(worst, self.degraded_ms, self.unhealthy_ms),
+            meta={"max_pause_ms": round(worst, 1)},
+        )
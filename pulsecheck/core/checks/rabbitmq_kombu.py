@@ -1,7 +1,10 @@
 from __future__ import annotations
 
+import threading
 import time
-from kombu import Connection, Exchange  # type: ignore
+from typing import Any, Dict, Optional
+
+from kombu import Connection, Exchange, Queue  # type: ignore
 
 from ..models import HealthCheckResult, HealthStatus
 from ..utils import now_ms, to_thread, with_timeout
@@ -9,6 +12,18 @@ from .base import CheckConfig, HealthCheck
 
 
 class RabbitMQKombuCheck(HealthCheck):
+    """
+    Keeps one AMQP connection and channel open (with heartbeats) across probes. A probe
+    is a heartbeat check plus one synchronous round-trip (`basic.qos`) on that channel.
+
+    A reused connection that fails the round-trip (e.g. closed by the broker after missed
+    heartbeats between widely spaced probes) is replaced and retried once within the
+    same probe. After a failure the connection is dropped and re-opened lazily by a later probe,
+    backing off exponentially; probes inside the backoff fail without touching the
+    network. The passive exchange/queue declare runs at most every `verify_interval_s`
+    (every probe when None).
+    """
+
     def __init__(
         self,
         amqp_url: str,
@@ -18,27 +33,126 @@ class RabbitMQKombuCheck(HealthCheck):
         degrade_threshold_ms: float = 1000.0,
         exchange_name: str | None = None,
         exchange_type: str = "direct",
+        queue_name: str | None = None,
+        heartbeat_s: float = 30.0,
+        verify_interval_s: Optional[float] = None,
+        reconnect_backoff_s: float = 1.0,
+        max_reconnect_backoff_s: float = 30.0,
     ) -> None:
         super().__init__(CheckConfig(name=name, readiness=True, timeout_s=timeout_s, degrade_threshold_ms=degrade_threshold_ms))
         self._url = amqp_url
         self._exchange_name = exchange_name
         self._exchange_type = exchange_type
+        self._queue_name = queue_name
+        self._heartbeat_s = heartbeat_s
+        self._verify_interval_s = verify_interval_s
+        self._backoff_base_s = reconnect_backoff_s
+        self._max_backoff_s = max_reconnect_backoff_s
+        self._conn: Optional[Connection] = None
+        self._channel: Any = None
+        self._lock = threading.Lock()
+        self._backoff_s = reconnect_backoff_s
+        self._retry_at = 0.0
+        self._last_error: Optional[BaseException] = None
+        self._verified_at: Optional[float] = None
+        self._opened = 0
 
-    async def check(self) -> HealthCheckResult:
-        start = time.perf_counter()
+    def _connect(self) -> None:
+        conn = Connection(self._url, connect_timeout=self.config.timeout_s, heartbeat=self._heartbeat_s)
+        try:
+            # One attempt; the check's own backoff decides when to try again.
+            conn.ensure_connection(max_retries=0)
+        except Exception:
+            conn.release()
+            raise
+        self._conn, self._channel = conn, None
+        self._opened += 1
+
+    def _drop(self) -> None:
+        conn, self._conn, self._channel = self._conn, None, None
+        if conn is not None:
+            try:
+                conn.release()
+            except Exception:
+                pass
+
+    def _verify(self) -> None:
+        if self._exchange_name:
+            Exchange(name=self._exchange_name, type=self._exchange_type, passive=True)(self._channel).declare()
+        if self._queue_name:
+            Queue(self._queue_name, channel=self._channel).queue_declare(passive=True)
 
-        def _sync() -> None:
-            with Connection(self._url, connect_timeout=self.config.timeout_s) as conn:
-                conn.ensure_connection(max_retries=1)
-                if self._exchange_name:
-                    exchange = Exchange(name=self._exchange_name, type=self._exchange_type, passive=True)
-                    with conn.channel() as channel:
-                        exchange(channel).declare()
+    def _roundtrip(self) -> float:
+        if self._conn is None or not self._conn.connected:
+            self._drop()
+            self._connect()
+        if self._channel is None:
+            self._channel = self._conn.channel()
+        rtt_start = time.perf_counter()
+        self._channel.basic_qos(0, 0, False)
+        rtt = now_ms(rtt_start)
+        # Sends our heartbeat if one is due; raises if the broker's stopped arriving.
+        self._conn.heartbeat_check(rate=2)
+        return rtt
 
+    def _probe(self) -> float:
+        """Returns the round-trip time in ms."""
+        if not self._lock.acquire(timeout=self.config.timeout_s):
+            raise TimeoutError("previous probe still holds the connection")
         try:
-            await with_timeout(to_thread(_sync), self.config.timeout_s)
+            now = time.monotonic()
+            if now < self._retry_at:
+                raise ConnectionError(f"reconnecting in {self._retry_at - now:.1f}s after {repr(self._last_error)}")
+            try:
+                reused = self._conn is not None and self._conn.connected
+                try:
+                    rtt = self._roundtrip()
+                except Exception:
+                    if not reused:
+                        raise
+                    # Heartbeats are only serviced by probes, so with probes spaced beyond
+                    # the heartbeat window the broker may have closed a connection that still
+                    # looks open. Retry once on a fresh connection before reporting failure.
+                    self._drop()
+                    rtt = self._roundtrip()
+            except Exception as e:
+                self._drop()
+                self._last_error = e
+                self._retry_at = time.monotonic() + self._backoff_s
+                self._backoff_s = min(self._backoff_s * 2, self._max_backoff_s)
+                raise
+            self._backoff_s = self._backoff_base_s
+
+            due = self._verified_at is None or self._verify_interval_s is None or now - self._verified_at >= self._verify_interval_s
+            if (self._exchange_name or self._queue_name) and due:
+                try:
+                    self._verify()
+                except Exception:
+                    # The broker closes the channel on a failed passive declare; the connection stays.
+                    self._channel = None
+                    raise
+                self._verified_at = now
+            return rtt
+        finally:
+            self._lock.release()
+
+    async def check(self) -> HealthCheckResult:
+        start = time.perf_counter()
+        try:
+            rtt = await with_timeout(to_thread(self._probe), self.config.timeout_s)
             elapsed = now_ms(start)
             status = HealthStatus.DEGRADED if (self.config.degrade_threshold_ms and elapsed > self.config.degrade_threshold_ms) else HealthStatus.HEALTHY
-            return HealthCheckResult(status=status, response_time_ms=elapsed)
+            meta: Dict[str, Any] = {"rtt_ms": round(rtt, 3), "reconnects": max(0, self._opened - 1)}
+            return HealthCheckResult(status=status, response_time_ms=elapsed, meta=meta)
         except Exception as e:
             return HealthCheckResult(status=HealthStatus.UNHEALTHY, error=f"RabbitMQ failed: {repr(e)}")
+
+    async def aclose(self) -> None:
+        def _close() -> None:
+            with self._lock:
+                self._drop()
+
+        try:
+            await to_thread(_close)
+        except Exception:
+            pass
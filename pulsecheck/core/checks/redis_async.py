@@ -1,31 +1,95 @@
 from __future__ import annotations
 
+import asyncio
 import time
+from typing import Optional
+
 import redis.asyncio as redis  # type: ignore
 
 from ..models import HealthCheckResult, HealthStatus
+from ..passive import PassiveWindow
 from ..utils import now_ms, with_timeout
 from .base import CheckConfig, HealthCheck
 
 
+def release_pool(pool: redis.ConnectionPool, loop: Optional[asyncio.AbstractEventLoop]) -> None:
+    """Disconnect `pool` on the loop its connections belong to, if that loop still runs."""
+    if loop is not None and loop.is_running() and not loop.is_closed():
+        asyncio.run_coroutine_threadsafe(pool.disconnect(), loop)
+    # Otherwise the loop is gone and its transports with it; the pool is just dropped.
+
+
 class RedisAsyncCheck(HealthCheck):
-    def __init__(self, redis_url: str, *, name: str = "redis", timeout_s: float = 2.0, degrade_threshold_ms: float = 100.0) -> None:
+    """
+    Pings Redis over a long-lived connection pool, so a probe costs one round-trip.
+
+    Pass `redis_url` to let the check own its pool (created lazily, closed by `aclose()`),
+    or share an existing `client` / `pool` which the check never closes.
+    """
+
+    def __init__(
+        self,
+        redis_url: Optional[str] = None,
+        *,
+        client: Optional[redis.Redis] = None,
+        pool: Optional[redis.ConnectionPool] = None,
+        name: str = "redis",
+        timeout_s: float = 2.0,
+        degrade_threshold_ms: float = 100.0,
+        max_connections: int = 2,
+        passive: Optional[PassiveWindow] = None,
+    ) -> None:
+        if redis_url is None and client is None and pool is None:
+            raise ValueError("RedisAsyncCheck needs one of redis_url, client or pool")
         super().__init__(CheckConfig(name=name, readiness=True, timeout_s=timeout_s, degrade_threshold_ms=degrade_threshold_ms))
         self._url = redis_url
+        self._max_connections = max_connections
+        self._owned = client is None and pool is None
+        self._client: Optional[redis.Redis] = client if client is not None else (redis.Redis(connection_pool=pool) if pool is not None else None)
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self.passive = passive
+
+    def _get_client(self) -> redis.Redis:
+        loop = asyncio.get_running_loop()
+        if self._owned and self._client is not None and self._loop is not loop:
+            # Async connections are bound to the loop that opened them.
+            release_pool(self._client.connection_pool, self._loop)
+            self._client = None
+        if self._client is None:
+            # Blocking: overlapping probes wait for a free connection instead of failing.
+            owned_pool = redis.BlockingConnectionPool.from_url(
+                self._url,
+                timeout=self.config.timeout_s,
+                socket_timeout=self.config.timeout_s,
+                socket_connect_timeout=self.config.timeout_s,
+                max_connections=self._max_connections,
+            )
+            self._client = redis.Redis(connection_pool=owned_pool)
+            self._loop = loop
+        return self._client
 
     async def check(self) -> HealthCheckResult:
+        passive = self.passive_result()
+        if passive is not None:
+            return passive
+
         start = time.perf_counter()
-        client = redis.from_url(self._url, socket_timeout=self.config.timeout_s)
 
         try:
+            client = self._get_client()
             await with_timeout(client.ping(), self.config.timeout_s)
             elapsed = now_ms(start)
             status = HealthStatus.DEGRADED if (self.config.degrade_threshold_ms and elapsed > self.config.degrade_threshold_ms) else HealthStatus.HEALTHY
             return HealthCheckResult(status=status, response_time_ms=elapsed)
         except Exception as e:
+            # redis-py disconnects the failed (or cancelled, half-read) connection itself;
+            # the rest of the pool may be serving other probes or the application.
             return HealthCheckResult(status=HealthStatus.UNHEALTHY, error=f"Redis failed: {repr(e)}")
-        finally:
+
+    async def aclose(self) -> None:
+        if self._owned and self._client is not None:
+            client, self._client = self._client, None
             try:
-                await client.aclose()
+                await client.connection_pool.disconnect()
             except Exception:
                 pass
@@ -0,0 +1,190 @@
+from __future__ import annotations
+
+import asyncio
+import time
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+from urllib.parse import urlsplit, urlunsplit
+
+import redis.asyncio as redis  # type: ignore
+
+from ..models import HealthCheckResult, HealthStatus
+from ..utils import now_ms, with_timeout
+from .base import CheckConfig, HealthCheck
+from .redis_async import release_pool
+
+CLUSTER_SLOTS = 16384
+
+
+def _with_host(url: str, addr: str) -> str:
+    """`url` with its host:port replaced by `addr`, keeping scheme, credentials and options."""
+    parts = urlsplit(url)
+    auth = parts.netloc.rpartition("@")[0]
+    return urlunsplit(parts._replace(netloc=f"{auth}@{addr}" if auth else addr))
+
+
+def _addr(url: str) -> str:
+    parts = urlsplit(url)
+    return f"{parts.hostname}:{parts.port or 6379}"
+
+
+class RedisClusterCheck(HealthCheck):
+    """
+    Probes every node of a Redis Cluster (or a static list of shards) concurrently, one
+    pipelined `PING` + `ROLE` round-trip per node over a persistent per-node connection.
+
+    Pass `nodes` (URLs) for a fixed node list, or `seed_url` to discover the nodes with
+    `CLUSTER NODES` (refreshed every `discover_interval_s`). Status rules:
+
+    - UNHEALTHY when fewer than `quorum` nodes answer (default: a majority), or, for a
+      discovered cluster, when the answering masters cover less than `min_slot_coverage`
+      of the 16384 slots.
+    - DEGRADED when any node is down but the rules above hold, or when the slowest node
+      exceeds `degrade_threshold_ms`.
+
+    Per-node role, latency and slot counts are reported in `meta.nodes`.
+    """
+
+    def __init__(
+        self,
+        nodes: Optional[Sequence[str]] = None,
+        *,
+        seed_url: Optional[str] = None,
+        name: str = "redis_cluster",
+        timeout_s: float = 2.0,
+        degrade_threshold_ms: float = 100.0,
+        quorum: Optional[int] = None,
+        min_slot_coverage: float = 1.0,
+        discover_interval_s: float = 60.0,
+    ) -> None:
+        if not nodes and seed_url is None:
+            raise ValueError("RedisClusterCheck needs nodes or seed_url")
+        super().__init__(CheckConfig(name=name, readiness=True, timeout_s=timeout_s, degrade_threshold_ms=degrade_threshold_ms))
+        self._static = {_addr(u): u for u in nodes or ()}
+        self._seed_url = seed_url
+        self._quorum = quorum
+        self._min_slot_coverage = min_slot_coverage
+        self._discover_interval_s = discover_interval_s
+        # addr -> url
+        self._nodes: Dict[str, str] = dict(self._static)
+        # addr -> number of slots it serves as master (discovered clusters only)
+        self._slots: Dict[str, int] = {}
+        self._discovered_at: Optional[float] = None
+        self._clients: Dict[str, redis.Redis] = {}
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+
+    def _client(self, addr: str) -> redis.Redis:
+        loop = asyncio.get_running_loop()
+        if self._loop is not loop:
+            # Async connections are bound to the loop that opened them.
+            for old in self._clients.values():
+                release_pool(old.connection_pool, self._loop)
+            self._clients = {}
+            self._loop = loop
+        client = self._clients.get(addr)
+        if client is None:
+            # Blocking: overlapping probes of a node wait for its connection instead of failing.
+            pool = redis.BlockingConnectionPool.from_url(
+                self._nodes[addr],
+                timeout=self.config.timeout_s,
+                socket_timeout=self.config.timeout_s,
+                socket_connect_timeout=self.config.timeout_s,
+                max_connections=1,
+            )
+            client = self._clients[addr] = redis.Redis(connection_pool=pool)
+        return client
+
+    async def _discover(self) -> None:
+        now = time.monotonic()
+        if self._seed_url is None or (self._discovered_at is not None and now - self._discovered_at < self._discover_interval_s):
+            return
+        # Any known node can answer; the seed comes first on the initial discovery.
+        candidates = [self._seed_url] + [u for u in self._nodes.values() if u != self._seed_url]
+        last_error: Optional[BaseException] = None
+        for url in candidates:
+            addr = _addr(url)
+            self._nodes.setdefault(addr, url)
+            try:
+                topology = await with_timeout(self._client(addr).execute_command("CLUSTER NODES"), self.config.timeout_s)
+                break
+            except Exception as e:
+                last_error = e
+        else:
+            if self._discovered_at is None:
+                raise ConnectionError(f"cluster discovery failed: {repr(last_error)}")
+            return
+
+        nodes: Dict[str, str] = dict(self._static)
+        slots: Dict[str, int] = {}
+        for addr, info in topology.items():
+            flags = info.get("flags", "")
+            if "noaddr" in flags or "handshake" in flags or addr.startswith(":"):
+                continue
+            nodes[addr] = _with_host(self._seed_url, addr)
+            if "master" in flags:
+                slots[addr] = sum(int(r[-1]) - int(r[0]) + 1 for r in info.get("slots", ()))
+        for addr in set(self._nodes) - set(nodes):
+            await self._drop(addr)
+        self._nodes, self._slots, self._discovered_at = nodes, slots, now
+
+    async def _drop(self, addr: str) -> None:
+        client = self._clients.pop(addr, None)
+        if client is not None:
+            try:
+                await client.connection_pool.disconnect()
+            except Exception:
+                pass
+
+    async def _probe_node(self, addr: str) -> Tuple[str, Dict[str, Any]]:
+        start = time.perf_counter()
+        try:
+            pipe = self._client(addr).pipeline(transaction=False)
+            pipe.ping()
+            pipe.execute_command("ROLE")
+            _, role = await with_timeout(pipe.execute(), self.config.timeout_s)
+            role_name = role[0].decode() if isinstance(role[0], bytes) else str(role[0])
+            return addr, {"status": HealthStatus.HEALTHY.value, "role": role_name, "latency_ms": round(now_ms(start), 3)}
+        except Exception as e:
+            # redis-py disconnects the failed (or cancelled, half-read) connection itself.
+            return addr, {"status": HealthStatus.UNHEALTHY.value, "error": repr(e)}
+
+    async def check(self) -> HealthCheckResult:
+        start = time.perf_counter()
+        try:
+            await self._discover()
+        except Exception as e:
+            return HealthCheckResult(status=HealthStatus.UNHEALTHY, error=f"Redis cluster failed: {repr(e)}")
+
+        results = dict(await asyncio.gather(*(self._probe_node(addr) for addr in self._nodes)))
+        up = [addr for addr, r in results.items() if r["status"] == HealthStatus.HEALTHY.value]
+        for addr, n in self._slots.items():
+            if addr in results and n:
+                results[addr]["slots"] = n
+
+        total = len(results)
+        quorum = self._quorum if self._quorum is not None else total // 2 + 1
+        meta: Dict[str, Any] = {"nodes": results, "up": len(up), "total": total, "quorum": quorum}
+        errors: List[str] = []
+        if len(up) < quorum:
+            errors.append(f"{len(up)}/{total} nodes up, quorum is {quorum}")
+        if self._slots:
+            covered = sum(n for addr, n in self._slots.items() if addr in up)
+            coverage = covered / CLUSTER_SLOTS
+            meta["slot_coverage"] = round(coverage, 4)
+            if coverage < self._min_slot_coverage:
+                errors.append(f"slot coverage {coverage:.1%} below {self._min_slot_coverage:.1%}")
+
+        elapsed = now_ms(start)
+        if errors:
+            return HealthCheckResult(status=HealthStatus.UNHEALTHY, response_time_ms=elapsed, error=f"Redis cluster failed: {'; '.join(errors)}", meta=meta)
+        slowest = max((r["latency_ms"] for r in results.values() if "latency_ms" in r), default=0.0)
+        degraded = len(up) < total or bool(self.config.degrade_threshold_ms and slowest > self.config.degrade_threshold_ms)
+        return HealthCheckResult(status=HealthStatus.DEGRADED if degraded else HealthStatus.HEALTHY, response_time_ms=elapsed, meta=meta)
+
+    async def aclose(self) -> None:
+        if self._loop is not None and self._loop is not asyncio.get_running_loop():
+            for client in self._clients.values():
+                release_pool(client.connection_pool, self._loop)
+            self._clients = {}
+            return
+        for addr in list(self._clients):
+            await self._drop(addr)
@@ -1,6 +1,9 @@
 from __future__ import annotations
 
+import threading
 import time
+from typing import Optional
+
 import redis  # type: ignore
 
 from ..models import HealthCheckResult, HealthStatus
@@ -9,22 +12,54 @@ from .base import CheckConfig, HealthCheck
 
 
 class RedisSyncCheck(HealthCheck):
-    def __init__(self, redis_url: str, *, name: str = "redis", timeout_s: float = 2.0, degrade_threshold_ms: float = 100.0) -> None:
+    """
+    Pings Redis over a long-lived connection pool, so a probe costs one round-trip.
+
+    Pass `redis_url` to let the check own its pool (created lazily, closed by `aclose()`),
+    or share an existing `client` / `pool` which the check never closes.
+    """
+
+    def __init__(
+        self,
+        redis_url: Optional[str] = None,
+        *,
+        client: Optional[redis.Redis] = None,
+        pool: Optional[redis.ConnectionPool] = None,
+        name: str = "redis",
+        timeout_s: float = 2.0,
+        degrade_threshold_ms: float = 100.0,
+        max_connections: int = 2,
+    ) -> None:
+        if redis_url is None and client is None and pool is None:
+            raise ValueError("RedisSyncCheck needs one of redis_url, client or pool")
         super().__init__(CheckConfig(name=name, readiness=True, timeout_s=timeout_s, degrade_threshold_ms=degrade_threshold_ms))
         self._url = redis_url
+        self._max_connections = max_connections
+        self._owned = client is None and pool is None
+        self._client: Optional[redis.Redis] = client if client is not None else (redis.Redis(connection_pool=pool) if pool is not None else None)
+        self._lock = threading.Lock()
+
+    def _get_client(self) -> redis.Redis:
+        with self._lock:
+            if self._client is None:
+                # Blocking: overlapping probes wait for a free connection instead of failing.
+                owned_pool = redis.BlockingConnectionPool.from_url(
+                    self._url,
+                    timeout=self.config.timeout_s,
+                    socket_timeout=self.config.timeout_s,
+                    socket_connect_timeout=self.config.timeout_s,
+                    max_connections=self._max_connections,
+                )
+                self._client = redis.Redis(connection_pool=owned_pool)
+            return self._client
 
     async def check(self) -> HealthCheckResult:
         start = time.perf_counter()
 
         def _sync() -> None:
-            client = redis.from_url(self._url, socket_timeout=self.config.timeout_s)
-            try:
-                client.ping()
-            finally:
-                try:
-                    client.close()
-                except Exception:
-                    pass
+            # redis-py disconnects a failed connection itself; the rest of the pool may
+            # be serving other probes or the application.
+            self._get_client().ping()
 
         try:
             await with_timeout(to_thread(_sync), self.config.timeout_s)
@@ -33,3 +68,11 @@ class RedisSyncCheck(HealthCheck):
             return HealthCheckResult(status=status, response_time_ms=elapsed)
         except Exception as e:
             return HealthCheckResult(status=HealthStatus.UNHEALTHY, error=f"Redis failed: {repr(e)}")
+
+    async def aclose(self) -> None:
+        if self._owned and self._client is not None:
+            client, self._client = self._client, None
+            try:
+                await to_thread(client.connection_pool.disconnect)
+            except Exception:
+                pass
@@ -1,30 +1,80 @@
 from __future__ import annotations
 
 import time
+from typing import Optional
+
 from sqlalchemy import text
-from sqlalchemy.ext.asyncio import AsyncEngine
+from sqlalchemy.ext.asyncio import AsyncEngine, create_async_engine
 
 from ..models import HealthCheckResult, HealthStatus
+from ..passive import PassiveWindow
+from ..status import combine_status
 from ..utils import now_ms, with_timeout
 from .base import CheckConfig, HealthCheck
+from .sqlalchemy_pool import pool_stats, pool_status, side_pool
 
 
 class SQLAlchemyAsyncCheck(HealthCheck):
-    def __init__(self, engine: AsyncEngine, *, name: str = "database", timeout_s: float = 2.0, degrade_threshold_ms: float = 500.0) -> None:
+    """
+    Runs `SELECT 1`. With `pool_stats=True` the engine's pool statistics are reported
+    under `meta.pool` and the check is DEGRADED once `pool_degraded_ratio` of the pool
+    is checked out or `pool_degraded_waiters` callers are waiting for a connection.
+    With `side_connection=True` the probe uses its own one-connection pool instead of
+    queuing behind application traffic.
+    """
+
+    def __init__(
+        self,
+        engine: AsyncEngine,
+        *,
+        name: str = "database",
+        timeout_s: float = 2.0,
+        degrade_threshold_ms: float = 500.0,
+        passive: Optional[PassiveWindow] = None,
+        pool_stats: bool = False,
+        pool_degraded_ratio: float = 0.9,
+        pool_degraded_waiters: int = 1,
+        side_connection: bool = False,
+    ) -> None:
         super().__init__(CheckConfig(name=name, readiness=True, timeout_s=timeout_s, degrade_threshold_ms=degrade_threshold_ms))
         self._engine = engine
+        self.passive = passive
+        self._pool_stats = pool_stats
+        self._pool_degraded_ratio = pool_degraded_ratio
+        self._pool_degraded_waiters = pool_degraded_waiters
+        self._side_connection = side_connection
+        self._side_engine: Optional[AsyncEngine] = None
+
+    def _probe_engine(self) -> AsyncEngine:
+        if not self._side_connection:
+            return self._engine
+        if self._side_engine is None:
+            self._side_engine = create_async_engine(self._engine.url, pool=side_pool(self._engine.sync_engine.pool))
+        return self._side_engine
 
     async def check(self) -> HealthCheckResult:
+        passive = self.passive_result()
+        if passive is not None:
+            return passive
+
+        stats = pool_stats(self._engine.sync_engine.pool) if self._pool_stats else None
+        meta = {"pool": stats} if stats is not None else None
         start = time.perf_counter()
 
         async def _run() -> None:
-            async with self._engine.connect() as conn:
+            async with self._probe_engine().connect() as conn:
                 await conn.execute(text("SELECT 1"))
 
         try:
             await with_timeout(_run(), self.config.timeout_s)
             elapsed = now_ms(start)
             status = HealthStatus.DEGRADED if (self.config.degrade_threshold_ms and elapsed > self.config.degrade_threshold_ms) else HealthStatus.HEALTHY
-            return HealthCheckResult(status=status, response_time_ms=elapsed)
+            status = combine_status(status, pool_status(stats, self._pool_degraded_ratio, self._pool_degraded_waiters))
+            return HealthCheckResult(status=status, response_time_ms=elapsed, meta=meta)
         except Exception as e:
-            return HealthCheckResult(status=HealthStatus.UNHEALTHY, error=f"Database failed: {repr(e)}")
+            return HealthCheckResult(status=HealthStatus.UNHEALTHY, error=f"Database failed: {repr(e)}", meta=meta)
+
+    async def aclose(self) -> None:
+        side, self._side_engine = self._side_engine, None
+        if side is not None:
+            await side.dispose()
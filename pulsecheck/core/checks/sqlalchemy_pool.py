@@ -0,0 +1,53 @@
+from __future__ import annotations
+
+from typing import Any, Dict, Optional
+
+from sqlalchemy.pool import Pool, QueuePool
+
+from ..models import HealthStatus
+
+
+def _waiters(queue: Any) -> Optional[int]:
+    # Neither queue exposes its waiters publicly; report them where the internals allow.
+    cond = getattr(queue, "not_empty", None)
+    if cond is not None and hasattr(cond, "_waiters"):
+        return len(cond._waiters)
+    aio_queue = queue.__dict__.get("_queue")  # created lazily on first use
+    if aio_queue is not None and hasattr(aio_queue, "_getters"):
+        return sum(1 for f in aio_queue._getters if not f.done())
+    return None
+
+
+def pool_stats(pool: Pool) -> Optional[Dict[str, Any]]:
+    """Checked-out connections, overflow and waiters of a QueuePool; None for other pool classes."""
+    if not isinstance(pool, QueuePool):
+        return None
+    size = pool.size()
+    max_overflow = pool._max_overflow
+    checked_out = pool.checkedout()
+    stats: Dict[str, Any] = {
+        "size": size,
+        "checked_out": checked_out,
+        "overflow": max(0, pool.overflow()),
+        "max_overflow": max_overflow,
+    }
+    waiters = _waiters(pool._pool)
+    if waiters is not None:
+        stats["waiters"] = waiters
+    if max_overflow >= 0 and size + max_overflow > 0:
+        stats["saturation"] = round(checked_out / (size + max_overflow), 3)
+    return stats
+
+
+def pool_status(stats: Optional[Dict[str, Any]], degraded_ratio: float, degraded_waiters: int) -> HealthStatus:
+    if stats is None:
+        return HealthStatus.HEALTHY
+    if stats.get("saturation", 0.0) >= degraded_ratio or stats.get("waiters", 0) >= degraded_waiters:
+        return HealthStatus.DEGRADED
+    return HealthStatus.HEALTHY
+
+
+def side_pool(pool: Pool) -> QueuePool:
+    """A one-connection pool built from `pool`'s connection factory, so probes never queue behind app traffic."""
+    cls = type(pool) if isinstance(pool, QueuePool) else QueuePool
+    return cls(pool._creator, pool_size=1, max_overflow=0, pre_ping=True, dialect=pool._dialect)
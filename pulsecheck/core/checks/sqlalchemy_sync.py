@@ -1,16 +1,25 @@
 from __future__ import annotations
-import anyio
 
 import time
-from sqlalchemy import text
+from typing import Optional
+
+from sqlalchemy import create_engine, text
 from sqlalchemy.engine import Engine
 
 from ..models import HealthCheckResult, HealthStatus
-from ..utils import now_ms
+from ..passive import PassiveWindow
+from ..status import combine_status
+from ..utils import now_ms, to_thread, with_timeout
 from .base import CheckConfig, HealthCheck
+from .sqlalchemy_pool import pool_stats, pool_status, side_pool
 
 
 class SQLAlchemySyncCheck(HealthCheck):
+    """
+    Runs `SELECT 1` on the check thread pool. `pool_stats`, `pool_degraded_ratio`,
+    `pool_degraded_waiters` and `side_connection` behave as in `SQLAlchemyAsyncCheck`.
+    """
+
     def __init__(
         self,
         engine: Engine,
@@ -18,6 +27,11 @@ class SQLAlchemySyncCheck(HealthCheck):
         name: str = "database",
         timeout_s: float = 2.0,
         degrade_threshold_ms: float = 500.0,
+        passive: Optional[PassiveWindow] = None,
+        pool_stats: bool = False,
+        pool_degraded_ratio: float = 0.9,
+        pool_degraded_waiters: int = 1,
+        side_connection: bool = False,
     ) -> None:
         super().__init__(
             CheckConfig(
@@ -28,16 +42,35 @@ class SQLAlchemySyncCheck(HealthCheck):
             )
         )
         self._engine = engine
+        self.passive = passive
+        self._pool_stats = pool_stats
+        self._pool_degraded_ratio = pool_degraded_ratio
+        self._pool_degraded_waiters = pool_degraded_waiters
+        self._side_connection = side_connection
+        self._side_engine: Optional[Engine] = None
+
+    def _probe_engine(self) -> Engine:
+        if not self._side_connection:
+            return self._engine
+        if self._side_engine is None:
+            self._side_engine = create_engine(self._engine.url, pool=side_pool(self._engine.pool))
+        return self._side_engine
 
     async def check(self) -> HealthCheckResult:
+        passive = self.passive_result()
+        if passive is not None:
+            return passive
+
+        stats = pool_stats(self._engine.pool) if self._pool_stats else None
+        meta = {"pool": stats} if stats is not None else None
         start = time.perf_counter()
 
         def _run():
-            with self._engine.connect() as conn:
+            with self._probe_engine().connect() as conn:
                 conn.execute(text("SELECT 1"))
 
         try:
-            await anyio.to_thread.run_sync(_run)
+            await with_timeout(to_thread(_run), self.config.timeout_s)
 
             elapsed = now_ms(start)
 
@@ -47,14 +80,25 @@ class SQLAlchemySyncCheck(HealthCheck):
                    and elapsed > self.config.degrade_threshold_ms
                 else HealthStatus.HEALTHY
             )
+            status = combine_status(
+                status,
+                pool_status(stats, self._pool_degraded_ratio, self._pool_degraded_waiters),
+            )
 
             return HealthCheckResult(
                 status=status,
                 response_time_ms=elapsed,
+                meta=meta,
             )
 
         except Exception as e:
             return HealthCheckResult(
                 status=HealthStatus.UNHEALTHY,
                 error=f"Database failed: {repr(e)}",
-            )
\ No newline at end of file
+                meta=meta,
+            )
+
+    async def aclose(self) -> None:
+        side, self._side_engine = self._side_engine, None
+        if side is not None:
+            await to_thread(side.dispose)
\ No newline at end of file
@@ -0,0 +1,88 @@
+from __future__ import annotations
+
+import hashlib
+import json
+from dataclasses import dataclass
+from typing import Any, Dict, Optional
+
+from .models import OverallHealthResponse
+from .status import http_status_from_health
+
+# orjson (optional, faster) is imported on first use rather than with the package.
+_orjson: Any = None
+
+
+def _backend() -> Any:
+    global _orjson
+    if _orjson is None:
+        try:
+            import orjson  # type: ignore
+
+            _orjson = orjson
+        except ImportError:  # pragma: no cover
+            _orjson = False
+    return _orjson
+
+
+def dumps(payload: Dict[str, Any]) -> bytes:
+    backend = _backend()
+    if backend:
+        return backend.dumps(payload)
+    return json.dumps(payload, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+def loads(data: bytes) -> Any:
+    backend = _backend()
+    if backend:
+        return backend.loads(data)
+    return json.loads(data)
+
+
+@dataclass(frozen=True)
+class EncodedResponse:
+    body: bytes
+    etag: str
+    status_code: int
+
+    def not_modified(self, if_none_match: Optional[str]) -> bool:
+        """True when the client already has this body. Only successful responses are ever 304."""
+        if not if_none_match or self.status_code != 200:
+            return False
+        if if_none_match.strip() == "*":
+            return True
+        own = self.etag.removeprefix("W/")
+        return any(tag.strip().removeprefix("W/") == own for tag in if_none_match.split(","))
+
+
+def etag(res: OverallHealthResponse) -> str:
+    """
+    Weak ETag over the verdict: overall status plus each check's status and error.
+    The timestamp, latencies and `meta` change on every run, so hashing the whole body
+    would never match outside the scheduler and shared modes.
+    """
+    h = hashlib.blake2b(f"{res.status.value}\0{res.environment}".encode(), digest_size=8)
+    for name, r in res.checks.items():
+        h.update(f"\0{name}\0{r.status.value}\0{r.error or ''}".encode())
+    return 'W/"' + h.hexdigest() + '"'
+
+
+def encode(res: OverallHealthResponse) -> EncodedResponse:
+    return EncodedResponse(body=dumps(res.to_dict()), etag=etag(res), status_code=http_status_from_health(res.status))
+
+
+class EncodedCache:
+    """
+    Keeps the encoded bytes of the last response per endpoint. Snapshots served from
+    the scheduler or the shared store are reused objects, so they are encoded once.
+    """
+
+    def __init__(self) -> None:
+        self._last: Dict[str, tuple] = {}
+
+    def get(self, key: str, res: OverallHealthResponse) -> EncodedResponse:
+        hit = self._last.get(key)
+        if hit is not None and hit[0] is res:
+            return hit[1]
+        enc = encode(res)
+        self._last[key] = (res, enc)
+        return enc
@@ -0,0 +1,100 @@
+from __future__ import annotations
+
+import asyncio
+import contextvars
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Callable, Dict, Optional, Tuple, TypeVar
+
+T = TypeVar("T")
+
+
+class ExecutorSaturated(RuntimeError):
+    pass
+
+
+class CheckExecutor:
+    """
+    Bounded thread pool for blocking checks, kept apart from the loop's default executor.
+
+    A timed-out probe cannot stop its thread; such threads are counted as abandoned
+    (per check) until they finish, so callers can avoid stacking probes behind them.
+    """
+
+    def __init__(self, *, max_workers: int = 4, max_queue: int = 8) -> None:
+        self.max_workers = max_workers
+        self.max_queue = max_queue
+        self._pool: Optional[ThreadPoolExecutor] = None
+        self._lock = threading.Lock()
+        self._pending = 0
+        self._abandoned: Dict[str, int] = {}
+
+    def _get_pool(self) -> ThreadPoolExecutor:
+        if self._pool is None:
+            with self._lock:
+                if self._pool is None:
+                    self._pool = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="pulsecheck-probe")
+        return self._pool
+
+    async def run(self, fn: Callable[[], T], *, key: str = "") -> T:
+        with self._lock:
+            if self._pending >= self.max_workers + self.max_queue:
+                raise ExecutorSaturated(f"{self._pending} blocking probes pending (limit {self.max_workers + self.max_queue})")
+            self._pending += 1
+
+        # Run in a copy of the caller's context, as asyncio.to_thread does.
+        cf: Future = self._get_pool().submit(contextvars.copy_context().run, fn)
+        cf.add_done_callback(self._release)
+        try:
+            return await asyncio.wrap_future(cf)
+        except asyncio.CancelledError:
+            if not cf.done():
+                with self._lock:
+                    self._abandoned[key] = self._abandoned.get(key, 0) + 1
+                cf.add_done_callback(lambda _: self._forget(key))
+            raise
+
+    def _release(self, _: Future) -> None:
+        with self._lock:
+            self._pending -= 1
+
+    def _forget(self, key: str) -> None:
+        with self._lock:
+            left = self._abandoned.get(key, 0) - 1
+            if left > 0:
+                self._abandoned[key] = left
+            else:
+                self._abandoned.pop(key, None)
+
+    def abandoned(self, key: str) -> int:
+        """Threads of timed-out probes for `key` that are still running."""
+        return self._abandoned.get(key, 0)
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {
+                "max_workers": self.max_workers,
+                "max_queue": self.max_queue,
+                "pending": self._pending,
+                "abandoned": sum(self._abandoned.values()),
+            }
+
+    def shutdown(self) -> None:
+        pool, self._pool = self._pool, None
+        if pool is not None:
+            pool.shutdown(wait=False, cancel_futures=True)
+
+
+_default_executor: Optional[CheckExecutor] = None
+
+# (executor, check name) of the check currently running, set by the registry.
+current_check: contextvars.ContextVar[Optional[Tuple[CheckExecutor, str]]] = contextvars.ContextVar(
+    "pulsecheck_current_check", default=None
+)
+
+
+def default_executor() -> CheckExecutor:
+    global _default_executor
+    if _default_executor is None:
+        _default_executor = CheckExecutor()
+    return _default_executor
@@ -0,0 +1,118 @@
+from __future__ import annotations
+
+import bisect
+import threading
+from typing import TYPE_CHECKING, Dict, List, Optional, Tuple
+
+from .models import HealthCheckResult, HealthStatus
+
+if TYPE_CHECKING:
+    from .registry import HealthRegistry
+
+# Upper bounds in seconds, Prometheus-style; the last bucket is +Inf.
+DEFAULT_BUCKETS_S: Tuple[float, ...] = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+
+class LatencyHistogram:
+    """Fixed-bucket histogram: memory does not grow with the number of observations."""
+
+    def __init__(self, buckets_s: Tuple[float, ...] = DEFAULT_BUCKETS_S) -> None:
+        self.buckets_s = buckets_s
+        self.counts: List[int] = [0] * (len(buckets_s) + 1)
+        self.sum_s = 0.0
+        self.count = 0
+
+    def observe(self, seconds: float) -> None:
+        self.counts[bisect.bisect_left(self.buckets_s, seconds)] += 1
+        self.sum_s += seconds
+        self.count += 1
+
+
+class CheckMetrics:
+    def __init__(self) -> None:
+        self.latency = LatencyHistogram()
+        self.results: Dict[HealthStatus, int] = {s: 0 for s in HealthStatus}
+        self.transitions = 0
+        self.last_status: Optional[HealthStatus] = None
+
+    def record(self, res: HealthCheckResult) -> None:
+        if res.response_time_ms is not None:
+            self.latency.observe(res.response_time_ms / 1000.0)
+        self.results[res.status] += 1
+        if self.last_status is not None and res.status != self.last_status:
+            self.transitions += 1
+        self.last_status = res.status
+
+
+class MetricsStore:
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self.checks: Dict[str, CheckMetrics] = {}
+
+    def record(self, name: str, res: HealthCheckResult) -> None:
+        with self._lock:
+            m = self.checks.get(name)
+            if m is None:
+                m = self.checks[name] = CheckMetrics()
+            m.record(res)
+
+
+def _label(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _num(value: float) -> str:
+    return repr(float(value)) if not float(value).is_integer() else str(int(value))
+
+
+def render_prometheus(registry: "HealthRegistry") -> str:
+    """Render the recorded metrics in Prometheus text format. Never triggers a probe."""
+    store = registry.metrics
+    out: List[str] = []
+
+    with store._lock:
+        items = sorted(store.checks.items())
+
+        out.append("# HELP pulsecheck_check_duration_seconds Health check probe latency.")
+        out.append("# TYPE pulsecheck_check_duration_seconds histogram")
+        for name, m in items:
+            lbl = _label(name)
+            h = m.latency
+            cumulative = 0
+            for bound, count in zip(h.buckets_s, h.counts):
+                cumulative += count
+                out.append(f'pulsecheck_check_duration_seconds_bucket{{check="{lbl}",le="{bound}"}} {cumulative}')
+            out.append(f'pulsecheck_check_duration_seconds_bucket{{check="{lbl}",le="+Inf"}} {h.count}')
+            out.append(f'pulsecheck_check_duration_seconds_sum{{check="{lbl}"}} {_num(h.sum_s)}')
+            out.append(f'pulsecheck_check_duration_seconds_count{{check="{lbl}"}} {h.count}')
+
+        out.append("# HELP pulsecheck_check_results_total Health check results by status.")
+        out.append("# TYPE pulsecheck_check_results_total counter")
+        for name, m in items:
+            lbl = _label(name)
+            for status, count in m.results.items():
+                out.append(f'pulsecheck_check_results_total{{check="{lbl}",status="{status.value}"}} {count}')
+
+        out.append("# HELP pulsecheck_check_transitions_total Status changes between consecutive results.")
+        out.append("# TYPE pulsecheck_check_transitions_total counter")
+        for name, m in items:
+            out.append(f'pulsecheck_check_transitions_total{{check="{_label(name)}"}} {m.transitions}')
+
+        out.append("# HELP pulsecheck_check_status Latest status of each check (1 for the current status).")
+        out.append("# TYPE pulsecheck_check_status gauge")
+        for name, m in items:
+            lbl = _label(name)
+            for status in HealthStatus:
+                out.append(f'pulsecheck_check_status{{check="{lbl}",status="{status.value}"}} {int(m.last_status == status)}')
+
+    stats = registry.executor.stats()
+    out.append("# HELP pulsecheck_executor_pending Blocking probes queued or running.")
+    out.append("# TYPE pulsecheck_executor_pending gauge")
+    out.append(f"pulsecheck_executor_pending {stats['pending']}")
+    out.append("# HELP pulsecheck_executor_abandoned Threads of timed-out probes still running.")
+    out.append("# TYPE pulsecheck_executor_abandoned gauge")
+    out.append(f"pulsecheck_executor_abandoned {stats['abandoned']}")
+
+    return "\n".join(out) + "\n"
@@ -0,0 +1,123 @@
+from __future__ import annotations
+
+import http
+from typing import TYPE_CHECKING, Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+from .metrics import CONTENT_TYPE as METRICS_CONTENT_TYPE
+from .metrics import render_prometheus
+
+if TYPE_CHECKING:
+    from .models import OverallHealthResponse
+    from .registry import HealthRegistry
+
+_Headers = List[Tuple[str, str]]
+
+
+# path -> (kind, group)
+_Routes = Dict[str, Tuple[str, Optional[str]]]
+
+
+def _routes(prefix: str, groups: Iterable[str] = ()) -> _Routes:
+    prefix = "/" + prefix.strip("/")
+    routes: _Routes = {
+        prefix: ("live", None),
+        prefix + "/live": ("live", None),
+        prefix + "/ready": ("ready", None),
+        prefix + "/metrics": ("metrics", None),
+    }
+    for group in groups:
+        routes[f"{prefix}/ready/{group}"] = ("ready", group)
+    return routes
+
+
+def _render(registry: "HealthRegistry", kind: str, group: Optional[str], res: Optional["OverallHealthResponse"], if_none_match: Optional[str]) -> Tuple[int, _Headers, bytes]:
+    if kind == "metrics":
+        body = render_prometheus(registry).encode()
+        return 200, [("content-type", METRICS_CONTENT_TYPE), ("content-length", str(len(body)))], body
+
+    assert res is not None
+    enc = registry.encode(res, key=registry.plan(group).key if kind == "ready" else kind)
+    if enc.not_modified(if_none_match):
+        return 304, [("etag", enc.etag)], b""
+    headers = [("content-type", "application/json"), ("content-length", str(len(enc.body))), ("etag", enc.etag)]
+    return enc.status_code, headers, enc.body
+
+
+class HealthASGIMiddleware:
+    """
+    Answers the health endpoints before the wrapped ASGI app (routing, dependencies,
+    auth/logging middleware) sees the request. Wrap the outermost app:
+
+        app = HealthASGIMiddleware(app, registry)
+    """
+
+    def __init__(self, app: Callable[..., Any], registry: "HealthRegistry", *, prefix: str = "/health") -> None:
+        self.app = app
+        self.registry = registry
+        self._routes = _routes(prefix, registry.groups)
+
+    async def __call__(self, scope: Dict[str, Any], receive: Callable[..., Any], send: Callable[..., Any]) -> None:
+        route = None
+        if scope["type"] == "http" and scope["method"] in ("GET", "HEAD"):
+            route = self._routes.get(scope["path"].rstrip("/") or "/")
+        if route is None:
+            await self.app(scope, receive, send)
+            return
+
+        kind, group = route
+        if kind == "ready":
+            res = await self.registry.readiness(group)
+        elif kind == "live":
+            res = self.registry.liveness()
+        else:
+            res = None
+
+        if_none_match = None
+        for name, value in scope.get("headers", ()):
+            if name == b"if-none-match":
+                if_none_match = value.decode("latin-1")
+                break
+
+        status, headers, body = _render(self.registry, kind, group, res, if_none_match)
+        await send({
+            "type": "http.response.start",
+            "status": status,
+            "headers": [(k.encode("latin-1"), v.encode("latin-1")) for k, v in headers],
+        })
+        await send({"type": "http.response.body", "body": b"" if scope["method"] == "HEAD" else body})
+
+
+class HealthWSGIMiddleware:
+    """
+    Answers the health endpoints before the wrapped WSGI app runs. In scheduler or
+    shared mode readiness is read from the background snapshot; otherwise the checks
+    run on the registry's background loop (see `HealthRegistry.readiness_sync`).
+
+        application = HealthWSGIMiddleware(get_wsgi_application(), registry)
+    """
+
+    def __init__(self, app: Callable[..., Iterable[bytes]], registry: "HealthRegistry", *, prefix: str = "/health") -> None:
+        self.app = app
+        self.registry = registry
+        self._routes = _routes(prefix, registry.groups)
+        # The background loop starts on the first readiness request, after any fork.
+
+    def __call__(self, environ: Dict[str, Any], start_response: Callable[..., Any]) -> Iterable[bytes]:
+        route = None
+        method = environ.get("REQUEST_METHOD", "GET")
+        if method in ("GET", "HEAD"):
+            route = self._routes.get(environ.get("PATH_INFO", "").rstrip("/") or "/")
+        if route is None:
+            return self.app(environ, start_response)
+
+        kind, group = route
+        if kind == "ready":
+            res = self.registry.readiness_sync(group)
+        elif kind == "live":
+            res = self.registry.liveness()
+        else:
+            res = None
+
+        status, headers, body = _render(self.registry, kind, group, res, environ.get("HTTP_IF_NONE_MATCH"))
+        start_response(f"{status} {http.HTTPStatus(status).phrase}", headers)
+        return [b"" if method == "HEAD" else body]
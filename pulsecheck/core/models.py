@@ -1,7 +1,7 @@
 from __future__ import annotations
 
-from dataclasses import dataclass, field
-from datetime import datetime, timezone
+from dataclasses import dataclass
+from datetime import datetime
 from enum import Enum
 from typing import Any, Dict, Optional
 
@@ -12,15 +12,64 @@ class HealthStatus(str, Enum):
     UNHEALTHY = "UNHEALTHY"
 
 
-@dataclass
 class HealthCheckResult:
-    status: HealthStatus
-    response_time_ms: Optional[float] = None
-    error: Optional[str] = None
-    meta: Dict[str, Any] = field(default_factory=dict)
+    """
+    Outcome of one probe. Slotted to keep per-result memory small; `meta` is only
+    allocated when a check actually sets it.
+    """
+
+    __slots__ = ("status", "response_time_ms", "error", "_meta")
+
+    def __init__(
+        self,
+        status: HealthStatus,
+        response_time_ms: Optional[float] = None,
+        error: Optional[str] = None,
+        meta: Optional[Dict[str, Any]] = None,
+    ) -> None:
+        self.status = status
+        self.response_time_ms = response_time_ms
+        self.error = error
+        self._meta = meta or None
+
+    @property
+    def meta(self) -> Dict[str, Any]:
+        if self._meta is None:
+            self._meta = {}
+        return self._meta
+
+    @meta.setter
+    def meta(self, value: Optional[Dict[str, Any]]) -> None:
+        self._meta = value or None
+
+    def to_dict(self) -> Dict[str, Any]:
+        out: Dict[str, Any] = {"status": self.status.value}
+        if self.response_time_ms is not None:
+            out["response_time_ms"] = self.response_time_ms
+        if self.error:
+            out["error"] = self.error
+        if self._meta:
+            out["meta"] = self._meta
+        return out
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, HealthCheckResult):
+            return NotImplemented
+        return (
+            self.status == other.status
+            and self.response_time_ms == other.response_time_ms
+            and self.error == other.error
+            and (self._meta or None) == (other._meta or None)
+        )
+
+    def __repr__(self) -> str:
+        return (
+            f"HealthCheckResult(status={self.status!r}, response_time_ms={self.response_time_ms!r}, "
+            f"error={self.error!r}, meta={self._meta or {}!r})"
+        )
 
 
-@dataclass
+@dataclass(slots=True)
 class OverallHealthResponse:
     status: HealthStatus
     timestamp: datetime
@@ -32,13 +81,22 @@ class OverallHealthResponse:
             "status": self.status.value,
             "timestamp": self.timestamp.isoformat(),
             "environment": self.environment,
-            "checks": {
-                name: {
-                    "status": res.status.value,
-                    **({"response_time_ms": res.response_time_ms} if res.response_time_ms is not None else {}),
-                    **({"error": res.error} if res.error else {}),
-                    **({"meta": res.meta} if res.meta else {}),
-                }
-                for name, res in self.checks.items()
-            },
+            "checks": {name: res.to_dict() for name, res in self.checks.items()},
         }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "OverallHealthResponse":
+        return cls(
+            status=HealthStatus(data["status"]),
+            timestamp=datetime.fromisoformat(data["timestamp"]),
+            environment=data["environment"],
+            checks={
+                name: HealthCheckResult(
+                    status=HealthStatus(res["status"]),
+                    response_time_ms=res.get("response_time_ms"),
+                    error=res.get("error"),
+                    meta=res.get("meta"),
+                )
+                for name, res in data["checks"].items()
+            },
+        )
@@ -0,0 +1,145 @@
+from __future__ import annotations
+
+import contextvars
+import inspect
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+from typing import Any, Deque, Iterator, Optional, Tuple
+
+from .models import HealthCheckResult, HealthStatus
+
+# True while a check's own probe runs (set by the registry); its traffic is not recorded,
+# so a window can't certify a dependency from the probe that is meant to confirm it.
+_probing: contextvars.ContextVar[bool] = contextvars.ContextVar("pulsecheck_probing", default=False)
+
+
+@contextmanager
+def probe_traffic() -> Iterator[None]:
+    """Calls made inside are active-probe traffic, which passive windows ignore."""
+    token = _probing.set(True)
+    try:
+        yield
+    finally:
+        _probing.reset(token)
+
+
+class PassiveWindow:
+    """
+    Sliding window of outcomes observed on real application traffic.
+
+    `verdict()` returns a result only when the window is conclusive: at least
+    `min_samples` outcomes in the last `window_s` seconds and a failure ratio no
+    higher than `max_failure_ratio`. Otherwise it returns None and the check
+    falls back to its active probe, which also confirms any failures seen.
+    """
+
+    def __init__(self, *, window_s: float = 30.0, min_samples: int = 5, max_failure_ratio: float = 0.0, max_samples: int = 512) -> None:
+        self.window_s = window_s
+        self.min_samples = min_samples
+        self.max_failure_ratio = max_failure_ratio
+        # (monotonic time, ok, latency ms)
+        self._samples: Deque[Tuple[float, bool, float]] = deque(maxlen=max_samples)
+        self._lock = threading.Lock()
+
+    def record(self, ok: bool, latency_ms: float) -> None:
+        if _probing.get():
+            return
+        with self._lock:
+            self._samples.append((time.monotonic(), ok, latency_ms))
+
+    def verdict(self, degrade_threshold_ms: Optional[float] = None) -> Optional[HealthCheckResult]:
+        cutoff = time.monotonic() - self.window_s
+        with self._lock:
+            while self._samples and self._samples[0][0] < cutoff:
+                self._samples.popleft()
+            samples = list(self._samples)
+
+        if len(samples) < self.min_samples:
+            return None
+        failures = sum(1 for _, ok, _ in samples if not ok)
+        if failures > self.max_failure_ratio * len(samples):
+            return None
+
+        latencies = sorted(latency for _, ok, latency in samples if ok)
+        if not latencies:
+            return None
+        median = latencies[len(latencies) // 2]
+        status = HealthStatus.DEGRADED if (degrade_threshold_ms and median > degrade_threshold_ms) else HealthStatus.HEALTHY
+        return HealthCheckResult(status=status, response_time_ms=median, meta={"source": "passive", "samples": len(samples)})
+
+
+def instrument_sqlalchemy(engine: Any, window: Optional[PassiveWindow] = None) -> PassiveWindow:
+    """
+    Record every statement executed on `engine` (sync `Engine` or `AsyncEngine`).
+    Disconnects and operational errors count as failures; other SQL errors mean
+    the database answered and count as successes.
+    """
+    from sqlalchemy import event, exc
+
+    window = window or PassiveWindow()
+    target = getattr(engine, "sync_engine", engine)
+
+    @event.listens_for(target, "before_cursor_execute")
+    def _before(conn, cursor, statement, parameters, context, executemany):
+        conn.info.setdefault("pulsecheck_start", []).append(time.perf_counter())
+
+    @event.listens_for(target, "after_cursor_execute")
+    def _after(conn, cursor, statement, parameters, context, executemany):
+        starts = conn.info.get("pulsecheck_start")
+        if starts:
+            window.record(True, (time.perf_counter() - starts.pop()) * 1000.0)
+
+    @event.listens_for(target, "handle_error")
+    def _error(ctx):
+        starts = ctx.connection.info.get("pulsecheck_start") if ctx.connection is not None else None
+        elapsed = (time.perf_counter() - starts.pop()) * 1000.0 if starts else 0.0
+        failed = ctx.is_disconnect or isinstance(ctx.sqlalchemy_exception, exc.OperationalError)
+        window.record(not failed, elapsed)
+
+    return window
+
+
+def instrument_redis(client: Any, window: Optional[PassiveWindow] = None) -> PassiveWindow:
+    """
+    Wrap `client.execute_command` (redis-py sync or asyncio client) to record every command.
+    Connection and timeout errors count as failures; error replies count as successes.
+    """
+    from redis.exceptions import ConnectionError, TimeoutError  # type: ignore
+
+    window = window or PassiveWindow()
+    execute = client.execute_command
+
+    if inspect.iscoroutinefunction(execute):
+        async def _execute_async(*args: Any, **kwargs: Any) -> Any:
+            start = time.perf_counter()
+            try:
+                result = await execute(*args, **kwargs)
+            except (ConnectionError, TimeoutError):
+                window.record(False, (time.perf_counter() - start) * 1000.0)
+                raise
+            except Exception:
+                window.record(True, (time.perf_counter() - start) * 1000.0)
+                raise
+            window.record(True, (time.perf_counter() - start) * 1000.0)
+            return result
+
+        client.execute_command = _execute_async
+    else:
+        def _execute(*args: Any, **kwargs: Any) -> Any:
+            start = time.perf_counter()
+            try:
+                result = execute(*args, **kwargs)
+            except (ConnectionError, TimeoutError):
+                window.record(False, (time.perf_counter() - start) * 1000.0)
+                raise
+            except Exception:
+                window.record(True, (time.perf_counter() - start) * 1000.0)
+                raise
+            window.record(True, (time.perf_counter() - start) * 1000.0)
+            return result
+
+        client.execute_command = _execute
+
+    return window
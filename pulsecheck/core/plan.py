@@ -0,0 +1,61 @@
+from __future__ import annotations
+
+from typing import Dict, Optional, Sequence, Tuple
+
+from .models import HealthCheckResult, HealthStatus, OverallHealthResponse
+from .status import combine_status
+
+
+class ExecutionPlan:
+    """
+    Precompiled selection of checks for one endpoint: which checks run (in registration
+    order), their dependency edges within the selection, the concurrency limit and the
+    key their encoded response is cached under. Built once per group by the registry
+    and rebuilt only when a check is registered.
+    """
+
+    __slots__ = ("group", "readiness_only", "key", "checks", "names", "depends_on", "max_concurrency", "_selected")
+
+    def __init__(
+        self,
+        *,
+        group: Optional[str],
+        readiness_only: bool,
+        checks: Sequence[object],
+        depends_on: Dict[str, Tuple[str, ...]],
+        max_concurrency: int,
+    ) -> None:
+        self.group = group
+        self.readiness_only = readiness_only
+        base = "ready" if readiness_only else "all"
+        self.key = f"{base}:{group}" if group is not None else base
+        self.checks: Tuple[object, ...] = tuple(checks)
+        self.names = frozenset(c.config.name for c in self.checks)  # type: ignore[attr-defined]
+        # Upstreams outside the selection are not run, so they cannot cause a skip.
+        self.depends_on: Dict[str, Tuple[str, ...]] = {}
+        for name, upstream in depends_on.items():
+            inside = tuple(u for u in upstream if u in self.names)
+            if name in self.names and inside:
+                self.depends_on[name] = inside
+        # None: every check fits within the limit, so no semaphore is needed.
+        self.max_concurrency: Optional[int] = max_concurrency if max_concurrency < len(self.checks) else None
+        # (full snapshot, this plan's view of it) of the last select()
+        self._selected: Optional[Tuple[OverallHealthResponse, OverallHealthResponse]] = None
+
+    def select(self, full: OverallHealthResponse) -> OverallHealthResponse:
+        """This plan's checks out of a full readiness snapshot (scheduler and shared mode)."""
+        if self.group is None:
+            return full
+        hit = self._selected
+        if hit is not None and hit[0] is full:
+            return hit[1]
+
+        overall = HealthStatus.HEALTHY
+        checks: Dict[str, HealthCheckResult] = {}
+        for name, res in full.checks.items():
+            if name in self.names:
+                checks[name] = res
+                overall = combine_status(overall, res.status)
+        res = OverallHealthResponse(status=overall, timestamp=full.timestamp, environment=full.environment, checks=checks)
+        self._selected = (full, res)
+        return res
@@ -0,0 +1,127 @@
+from __future__ import annotations
+
+import asyncio
+import concurrent.futures
+import threading
+from typing import TYPE_CHECKING, Any, AsyncIterator, Dict, Optional, Set, Tuple, Union
+
+from .encoding import dumps
+from .models import OverallHealthResponse
+
+if TYPE_CHECKING:
+    from .registry import HealthRegistry
+
+# ("snapshot" | "change", payload)
+HealthEvent = Tuple[str, Dict[str, Any]]
+
+
+def diff(prev: OverallHealthResponse, res: OverallHealthResponse) -> Optional[Dict[str, Any]]:
+    """Checks whose status changed (or that appeared/disappeared); None when nothing did."""
+    changed = {
+        name: r.to_dict()
+        for name, r in res.checks.items()
+        if name not in prev.checks or prev.checks[name].status != r.status
+    }
+    removed = [name for name in prev.checks if name not in res.checks]
+    if not changed and not removed and prev.status == res.status:
+        return None
+    out: Dict[str, Any] = {
+        "status": res.status.value,
+        "timestamp": res.timestamp.isoformat(),
+        "checks": changed,
+    }
+    if removed:
+        out["removed"] = removed
+    return out
+
+
+class HealthPublisher:
+    """
+    Fans readiness snapshots out to subscribers. Every subscriber gets the full
+    snapshot on connect, then only per-check status changes. One probe cycle
+    serves any number of subscribers, across threads and event loops.
+    """
+
+    def __init__(self, registry: "HealthRegistry", *, interval_s: float = 5.0) -> None:
+        self._registry = registry
+        # Without background probing, a pump runs readiness this often while anyone is subscribed.
+        self.interval_s = interval_s
+        self._subscribers: Set[Tuple[asyncio.AbstractEventLoop, asyncio.Queue]] = set()
+        self._last: Optional[OverallHealthResponse] = None
+        self._lock = threading.Lock()
+        self._pump: Optional[Union[asyncio.Task, concurrent.futures.Future]] = None
+
+    def _after_fork(self) -> None:
+        self._subscribers = set()
+        self._pump = None
+        self._lock = threading.Lock()
+
+    def publish(self, res: OverallHealthResponse) -> None:
+        with self._lock:
+            prev, self._last = self._last, res
+            if prev is None or prev is res:
+                return
+            change = diff(prev, res)
+            if change is None:
+                return
+            subscribers = list(self._subscribers)
+
+        event: HealthEvent = ("change", change)
+        for loop, queue in subscribers:
+            try:
+                loop.call_soon_threadsafe(queue.put_nowait, event)
+            except RuntimeError:
+                # The subscriber's loop is closed; it unsubscribes on its way out.
+                pass
+
+    async def _pump_loop(self) -> None:
+        while True:
+            await asyncio.sleep(self.interval_s)
+            await self._registry.run(readiness_only=True)
+
+    async def subscribe(self, *, keepalive_s: float = 15.0) -> AsyncIterator[Optional[HealthEvent]]:
+        """Yield the snapshot, then changes; yields None every `keepalive_s` without a change."""
+        loop = asyncio.get_running_loop()
+        queue: asyncio.Queue = asyncio.Queue()
+        entry = (loop, queue)
+
+        bg = self._registry._bg_loop
+        if bg is not None and bg is not loop:
+            # Probes run on the process's background loop; only the queue lives on this one.
+            snap = await asyncio.wrap_future(self._registry.submit(self._registry.readiness()))
+        else:
+            bg = None
+            snap = await self._registry.readiness()
+        self.publish(snap)
+        with self._lock:
+            self._subscribers.add(entry)
+            if not self._registry.background and (self._pump is None or self._pump.done()):
+                if bg is not None:
+                    self._pump = asyncio.run_coroutine_threadsafe(self._pump_loop(), bg)
+                else:
+                    self._pump = loop.create_task(self._pump_loop())
+        try:
+            yield ("snapshot", snap.to_dict())
+            while True:
+                try:
+                    yield await asyncio.wait_for(queue.get(), keepalive_s)
+                except asyncio.TimeoutError:
+                    yield None
+        finally:
+            with self._lock:
+                self._subscribers.discard(entry)
+                pump = self._pump if not self._subscribers else None
+                if pump is not None:
+                    self._pump = None
+            if isinstance(pump, asyncio.Task):
+                pump.get_loop().call_soon_threadsafe(pump.cancel)
+            elif pump is not None:
+                pump.cancel()
+
+
+def sse_encode(event: Optional[HealthEvent]) -> bytes:
+    """Server-Sent Events framing; None becomes a keep-alive comment."""
+    if event is None:
+        return b": keep-alive\n\n"
+    kind, payload = event
+    return b"event: " + kind.encode() + b"\ndata: " + dumps(payload) + b"\n\n"
@@ -1,58 +1,373 @@
 from __future__ import annotations
 
 import asyncio
+import concurrent.futures
+import os
+import threading
+import weakref
 from datetime import datetime, timezone
-from typing import Dict, List, Optional
+from typing import Any, Coroutine, Dict, List, Optional, Sequence, Tuple, TypeVar
 
+from .checks.liveness import LivenessCheck
+from .coalesce import SingleFlight
+from .encoding import EncodedCache, EncodedResponse
+from .executor import CheckExecutor, current_check, default_executor
+from .metrics import MetricsStore
 from .models import HealthCheckResult, HealthStatus, OverallHealthResponse
+from .passive import probe_traffic
+from .plan import ExecutionPlan
+from .pubsub import HealthPublisher
+from .scheduler import ProbeScheduler, SchedulerConfig
+from .shared import SharedSnapshot, SharedSnapshotConfig
 from .status import combine_status
 
+T = TypeVar("T")
+
+
+def _reset_in_child(ref: "weakref.ref[HealthRegistry]") -> None:
+    registry = ref()
+    if registry is not None:
+        registry._after_fork()
+
 
 class HealthRegistry:
-    def __init__(self, *, environment: str, max_concurrency: int = 10) -> None:
+    def __init__(
+        self,
+        *,
+        environment: str,
+        max_concurrency: int = 10,
+        scheduler: Optional[SchedulerConfig] = None,
+        coalesce: bool = True,
+        result_ttl_s: float = 0.0,
+        executor: Optional[CheckExecutor] = None,
+        deadline_s: Optional[float] = None,
+        fail_fast: bool = False,
+        shared: Optional[SharedSnapshotConfig] = None,
+    ) -> None:
+        if scheduler is not None and shared is not None:
+            raise ValueError("Use either scheduler or shared snapshot mode, not both")
         self.environment = environment
         self._checks: List[object] = []
+        # check name -> names of upstream checks it depends on
+        self._depends_on: Dict[str, Tuple[str, ...]] = {}
+        self._liveness: List[LivenessCheck] = []
+        # (group, readiness_only) -> compiled plan; cleared whenever a check is registered
+        self._plans: Dict[Tuple[Optional[str], bool], ExecutionPlan] = {}
         self._max_concurrency = max_concurrency
+        self.scheduler: Optional[ProbeScheduler] = ProbeScheduler(self, scheduler) if scheduler else None
+        self.shared: Optional[SharedSnapshot] = SharedSnapshot(self, shared) if shared else None
+        # Concurrent callers share one in-flight run (and each check one in-flight probe).
+        self._flight: Optional[SingleFlight] = SingleFlight(result_ttl_s) if coalesce else None
+        # Per-check flights cost a task per probe, so they are only used where probes of one
+        # check overlap across runs: scheduler loops or the shared leader next to request
+        # runs, or results reused for a TTL. Otherwise the run-level flight is enough.
+        overlap = scheduler is not None or shared is not None or result_ttl_s > 0
+        self._check_flight: Optional[SingleFlight] = self._flight if overlap else None
+        self.executor = executor or default_executor()
+        # Answer within `deadline_s` even if some checks are still running;
+        # with `fail_fast`, stop at the first UNHEALTHY result.
+        self._deadline_s = deadline_s
+        self._fail_fast = fail_fast
+        self.metrics = MetricsStore()
+        self._encoded = EncodedCache()
+        self.events = HealthPublisher(self)
+        self._bg_loop: Optional[asyncio.AbstractEventLoop] = None
+        self._bg_thread: Optional[threading.Thread] = None
+        self._bg_lock = threading.Lock()
+        if hasattr(os, "register_at_fork"):
+            # With fork-after-import (gunicorn --preload) the child inherits a background
+            # thread that isn't running there; it starts its own on first use instead.
+            ref = weakref.ref(self)
+            os.register_at_fork(after_in_child=lambda: _reset_in_child(ref))
 
-    def register(self, check: object) -> None:
+    def register(self, check: object, *, depends_on: Sequence[str] = (), tags: Sequence[str] = ()) -> None:
+        """
+        Add a check. `depends_on` names checks registered earlier; while any of them is
+        UNHEALTHY this check is skipped (reported UNHEALTHY) instead of probed.
+        `tags` (added to `config.tags`) put the check into groups served at `/ready/<tag>`.
+        """
         # We keep it generic; checks must expose `config` and async `check()`.
+        known = {c.config.name for c in self._checks}  # type: ignore[attr-defined]
+        missing = [name for name in depends_on if name not in known]
+        if missing:
+            raise ValueError(f"Unknown upstream check(s) {missing}; register them before their dependents")
+        if tags:
+            check.config.tags = tuple(dict.fromkeys((*check.config.tags, *tags)))  # type: ignore[attr-defined]
         self._checks.append(check)
+        self._plans.clear()
+        if depends_on:
+            self._depends_on[check.config.name] = tuple(depends_on)  # type: ignore[attr-defined]
+        if self.scheduler is not None:
+            # A running scheduler probes the new check right away; shared mode picks it
+            # up on the leader's next run, which recompiles the plan.
+            self.scheduler.add(check)
+
+    def _skipped(self, name: str, upstream: Dict[str, HealthCheckResult]) -> Optional[HealthCheckResult]:
+        failed = [u for u in self._depends_on.get(name, ()) if u in upstream and upstream[u].status == HealthStatus.UNHEALTHY]
+        if not failed:
+            return None
+        return HealthCheckResult(
+            status=HealthStatus.UNHEALTHY,
+            error=f"Skipped: upstream {', '.join(failed)} unhealthy",
+            meta={"skipped": True, "upstream": failed},
+        )
+
+    @property
+    def groups(self) -> Tuple[str, ...]:
+        """Tags of registered readiness checks, in first-seen order."""
+        seen: Dict[str, None] = {}
+        for c in self._checks:
+            if c.config.readiness:  # type: ignore[attr-defined]
+                seen.update(dict.fromkeys(c.config.tags))  # type: ignore[attr-defined]
+        return tuple(seen)
+
+    def plan(self, group: Optional[str] = None, *, readiness_only: bool = True) -> ExecutionPlan:
+        """Execution plan for `group` (all checks when None), compiled on first use."""
+        key = (group, readiness_only)
+        plan = self._plans.get(key)
+        if plan is None:
+            if group is not None and group not in self.groups:
+                raise ValueError(f"Unknown check group {group!r}")
+            selected = [
+                c
+                for c in self._checks
+                if (not readiness_only or c.config.readiness) and (group is None or group in c.config.tags)  # type: ignore[attr-defined]
+            ]
+            plan = self._plans[key] = ExecutionPlan(
+                group=group,
+                readiness_only=readiness_only,
+                checks=selected,
+                depends_on=self._depends_on,
+                max_concurrency=self._max_concurrency,
+            )
+        return plan
+
+    def register_liveness(self, check: LivenessCheck) -> None:
+        """Add an in-process liveness signal (event-loop lag, executor queue, resources, GC)."""
+        self._liveness.append(check)
 
     def liveness(self) -> OverallHealthResponse:
+        overall = HealthStatus.HEALTHY
+        checks: Dict[str, HealthCheckResult] = {}
+        for c in self._liveness:
+            try:
+                res = c.evaluate()
+            except Exception as e:
+                res = HealthCheckResult(status=HealthStatus.UNHEALTHY, error=f"Check crashed: {repr(e)}")
+            checks[c.name] = res
+            overall = combine_status(overall, res.status)
         return OverallHealthResponse(
-            status=HealthStatus.HEALTHY,
+            status=overall,
             timestamp=datetime.now(timezone.utc),
             environment=self.environment,
-            checks={},
+            checks=checks,
         )
 
-    async def readiness(self) -> OverallHealthResponse:
-        return await self.run(readiness_only=True)
+    @property
+    def background(self) -> bool:
+        """True when readiness is served from background probing (scheduler or shared mode)."""
+        return self.scheduler is not None or self.shared is not None
 
-    async def run(self, *, readiness_only: bool = False) -> OverallHealthResponse:
-        checks_out: Dict[str, HealthCheckResult] = {}
-        overall = HealthStatus.HEALTHY
+    async def readiness(self, group: Optional[str] = None) -> OverallHealthResponse:
+        plan = self.plan(group)
+        if self.shared is not None:
+            if not self.shared.running:
+                await self.shared.start()
+            return plan.select(self.shared.snapshot())
+        if self.scheduler is not None:
+            if not self.scheduler.running:
+                await self.scheduler.start()
+            return plan.select(self.scheduler.snapshot(readiness_only=True))
+        return await self.run(readiness_only=True, group=group)
+
+    def subscribe(self, *, keepalive_s: float = 15.0):
+        """Async iterator of readiness events: the snapshot first, then per-check status changes."""
+        return self.events.subscribe(keepalive_s=keepalive_s)
+
+    def snapshot(self, group: Optional[str] = None) -> Optional[OverallHealthResponse]:
+        """Latest background readiness snapshot without awaiting; None unless scheduler/shared mode is running."""
+        if self.shared is not None and self.shared.running:
+            return self.plan(group).select(self.shared.snapshot())
+        if self.scheduler is not None and self.scheduler.running:
+            return self.plan(group).select(self.scheduler.snapshot(readiness_only=True))
+        return None
+
+    def encode(self, res: OverallHealthResponse, *, key: str = "ready") -> EncodedResponse:
+        """JSON bytes, ETag and HTTP status for `res`, reused while the snapshot is unchanged."""
+        return self._encoded.get(key, res)
+
+    async def start(self) -> None:
+        """Start background probing in the running event loop (scheduler or shared mode)."""
+        if self.shared is not None:
+            await self.shared.start()
+        if self.scheduler is not None:
+            await self.scheduler.start()
+
+    def start_background(self) -> None:
+        """Start background probing on a dedicated daemon thread with its own event loop."""
+        with self._bg_lock:
+            if self._bg_thread is not None:
+                return
+            loop = asyncio.new_event_loop()
+            self._bg_thread = threading.Thread(target=loop.run_forever, name="pulsecheck", daemon=True)
+            self._bg_thread.start()
+            self._bg_loop = loop
+        asyncio.run_coroutine_threadsafe(self.start(), loop).result()
+
+    def submit(self, coro: Coroutine[Any, Any, T]) -> concurrent.futures.Future[T]:
+        """Run `coro` on the background loop (started on first use) from any other thread."""
+        self.start_background()
+        loop = self._bg_loop
+        assert loop is not None
+        return asyncio.run_coroutine_threadsafe(coro, loop)
 
-        sem = asyncio.Semaphore(self._max_concurrency)
+    def readiness_sync(self, group: Optional[str] = None) -> OverallHealthResponse:
+        """
+        Readiness for sync callers (WSGI views and middleware): the background snapshot when
+        there is one, otherwise a run on the background loop. Checks always run on that one
+        loop, so loop-bound clients and in-flight coalescing are shared by all threads.
+        """
+        res = self.snapshot(group)
+        if res is not None:
+            return res
+        return self.submit(self.readiness(group)).result()
 
-        async def _run_one(c) -> None:
-            nonlocal overall
+    async def stop(self) -> None:
+        """Stop background probing and release resources held by checks."""
+        if self.shared is not None:
+            await self.shared.stop()
+        if self.scheduler is not None:
+            await self.scheduler.stop()
+        for c in self._checks:
+            aclose = getattr(c, "aclose", None)
+            if aclose is not None:
+                await aclose()
+        for c in self._liveness:
+            close = getattr(c, "close", None)
+            if close is not None:
+                close()
+
+    def _after_fork(self) -> None:
+        self._bg_loop = self._bg_thread = None
+        self._bg_lock = threading.Lock()
+        if self.scheduler is not None:
+            self.scheduler._after_fork()
+        self.events._after_fork()
+
+    def stop_background(self) -> None:
+        with self._bg_lock:
+            loop, thread = self._bg_loop, self._bg_thread
+            self._bg_loop = self._bg_thread = None
+        if loop is None or thread is None:
+            return
+        asyncio.run_coroutine_threadsafe(self.stop(), loop).result()
+        loop.call_soon_threadsafe(loop.stop)
+        thread.join()
+        loop.close()
+
+    async def _probe(self, c) -> HealthCheckResult:
+        if self._check_flight is not None:
+            return await self._check_flight.do(("check", c.config.name), lambda: self._execute(c))
+        return await self._execute(c)
+
+    async def _execute(self, c) -> HealthCheckResult:
+        name = c.config.name
+        breaker = getattr(c, "breaker", None)
+        if breaker is not None and not breaker.allow():
+            return breaker.open_result()
+
+        stuck = self.executor.abandoned(name)
+        if stuck:
+            # Don't queue another blocking probe behind ones that never returned.
+            return HealthCheckResult(
+                status=HealthStatus.UNHEALTHY,
+                error=f"Probe skipped: {stuck} earlier probe(s) still running",
+                meta={"stuck_threads": stuck},
+            )
+
+        res: Optional[HealthCheckResult] = None
+        token = current_check.set((self.executor, name))
+        try:
+            with probe_traffic():
+                res = await c.check()  # type: ignore[attr-defined]
+        except Exception as e:
+            res = HealthCheckResult(status=HealthStatus.UNHEALTHY, error=f"Check crashed: {repr(e)}")
+        finally:
+            current_check.reset(token)
+            if breaker is not None:
+                breaker.record(res)
+        self.metrics.record(name, res)
+        return res
+
+    async def run(self, *, readiness_only: bool = False, group: Optional[str] = None) -> OverallHealthResponse:
+        plan = self.plan(group, readiness_only=readiness_only)
+        if self._flight is not None:
+            return await self._flight.do(("run", plan.key), lambda: self._run(plan))
+        return await self._run(plan)
+
+    async def _run(self, plan: ExecutionPlan) -> OverallHealthResponse:
+        sem = asyncio.Semaphore(plan.max_concurrency) if plan.max_concurrency is not None else None
+
+        async def _run_one(c) -> HealthCheckResult:
+            name = c.config.name
+            upstream_names = plan.depends_on.get(name)
+            if upstream_names:
+                # asyncio.wait, unlike gather, never cancels the upstream tasks on our behalf.
+                await asyncio.wait([tasks[u] for u in upstream_names])
+                skipped = self._skipped(name, {u: tasks[u].result() for u in upstream_names})
+                if skipped is not None:
+                    return skipped
+            if sem is None:
+                return await self._probe(c)
             async with sem:
-                name = c.config.name  # type: ignore[attr-defined]
-                if readiness_only and not c.config.readiness:  # type: ignore[attr-defined]
-                    return
-                try:
-                    res: HealthCheckResult = await c.check()  # type: ignore[attr-defined]
-                except Exception as e:
-                    res = HealthCheckResult(status=HealthStatus.UNHEALTHY, error=f"Check crashed: {repr(e)}")
-                checks_out[name] = res
-                overall = combine_status(overall, res.status)
-
-        await asyncio.gather(*[_run_one(c) for c in self._checks])
+                return await self._probe(c)
 
-        return OverallHealthResponse(
+        # Dependents wait on their upstream tasks, so independent checks still run in parallel.
+        tasks: Dict[str, asyncio.Future] = {}
+        for c in plan.checks:
+            tasks[c.config.name] = asyncio.ensure_future(_run_one(c))  # type: ignore[attr-defined]
+        results: Dict[str, HealthCheckResult] = {}
+        aborted_by: Optional[str] = None
+
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + self._deadline_s if self._deadline_s is not None else None
+        when = asyncio.FIRST_COMPLETED if self._fail_fast else asyncio.ALL_COMPLETED
+        pending = set(tasks.values())
+
+        while pending and aborted_by is None:
+            timeout = None if deadline is None else max(0.0, deadline - loop.time())
+            done, pending = await asyncio.wait(pending, timeout=timeout, return_when=when)
+            if not done:
+                break
+            for name, task in tasks.items():
+                if task in done:
+                    res = results[name] = task.result()
+                    if self._fail_fast and res.status == HealthStatus.UNHEALTHY and aborted_by is None:
+                        aborted_by = name
+
+        # Whatever is still running is abandoned; the response goes out now.
+        for task in pending:
+            task.cancel()
+
+        checks_out: Dict[str, HealthCheckResult] = {}
+        overall = HealthStatus.HEALTHY
+        for name in tasks:
+            res = results.get(name)
+            if res is None:
+                if aborted_by is not None:
+                    res = HealthCheckResult(status=HealthStatus.UNHEALTHY, error=f"Cancelled: {aborted_by} is unhealthy")
+                else:
+                    res = HealthCheckResult(status=HealthStatus.UNHEALTHY, error=f"Timed out: registry deadline of {self._deadline_s * 1000:.0f} ms exceeded")
+            checks_out[name] = res
+            overall = combine_status(overall, res.status)
+
+        res = OverallHealthResponse(
             status=overall,
             timestamp=datetime.now(timezone.utc),
             environment=self.environment,
             checks=checks_out,
         )
+        if plan.readiness_only and plan.group is None:
+            # Only full readiness runs feed subscribers; a group is a partial view.
+            self.events.publish(res)
+        return res
@@ -0,0 +1,164 @@
+from __future__ import annotations
+
+import asyncio
+import random
+import time
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from typing import TYPE_CHECKING, Dict, List, Optional, Tuple
+
+from .models import HealthCheckResult, HealthStatus, OverallHealthResponse
+from .status import combine_status
+
+if TYPE_CHECKING:
+    from .registry import HealthRegistry
+
+
+@dataclass
+class SchedulerConfig:
+    interval_s: float = 10.0
+    jitter: float = 0.1
+    # Results older than this are reported UNHEALTHY. Defaults to 3x the check interval.
+    max_age_s: Optional[float] = None
+
+
+class ProbeScheduler:
+    """
+    Runs every registered check on its own interval in the background and keeps
+    the latest result in memory, so readiness can be answered without probing.
+    """
+
+    def __init__(self, registry: "HealthRegistry", config: SchedulerConfig) -> None:
+        self._registry = registry
+        self.config = config
+        # name -> (result, monotonic time, wall clock time)
+        self._latest: Dict[str, Tuple[HealthCheckResult, float, datetime]] = {}
+        self._tasks: List[asyncio.Task] = []
+        self._started = False
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        # Bumped on every stored result; snapshots are rebuilt only when it (or staleness) changes.
+        self._version = 0
+        self._snapshots: Dict[bool, Tuple[tuple, OverallHealthResponse]] = {}
+
+    @property
+    def running(self) -> bool:
+        return self._started
+
+    def _interval(self, check) -> float:
+        return check.config.interval_s or self.config.interval_s
+
+    def _max_age(self, check) -> float:
+        if self.config.max_age_s is not None:
+            return self.config.max_age_s
+        return 3 * self._interval(check)
+
+    def _levels(self) -> List[list]:
+        depth: Dict[str, int] = {}
+        levels: List[list] = []
+        # Upstream checks are always registered before their dependents.
+        for c in self._registry._checks:
+            name = c.config.name
+            depth[name] = 1 + max((depth[u] for u in self._registry._depends_on.get(name, ())), default=-1)
+            if depth[name] == len(levels):
+                levels.append([])
+            levels[depth[name]].append(c)
+        return levels
+
+    async def _probe_and_store(self, check) -> None:
+        upstream = {name: entry[0] for name, entry in self._latest.items()}
+        res = self._registry._skipped(check.config.name, upstream) or await self._registry._probe(check)
+        self._latest[check.config.name] = (res, time.monotonic(), datetime.now(timezone.utc))
+        self._version += 1
+        if self._tasks:
+            self._registry.events.publish(self.snapshot(readiness_only=True))
+
+    async def _loop_one(self, check, *, probe_first: bool = False) -> None:
+        interval = self._interval(check)
+        jitter = self.config.jitter
+        if probe_first:
+            await self._probe_and_store(check)
+        while True:
+            await asyncio.sleep(interval * (1 + random.uniform(-jitter, jitter)))
+            await self._probe_and_store(check)
+
+    async def start(self) -> None:
+        if self._started:
+            return
+        self._started = True
+        self._loop = asyncio.get_running_loop()
+        levels = self._levels()
+        # Loops are created before the warm-up awaits; a check registered meanwhile
+        # gets its own loop from add().
+        self._tasks = [asyncio.create_task(self._loop_one(c)) for level in levels for c in level]
+        # Warm the snapshot once so the first readiness answer is meaningful,
+        # level by level so dependents see their upstream results.
+        for level in levels:
+            await asyncio.gather(*(self._probe_and_store(c) for c in level))
+        self._registry.events.publish(self.snapshot(readiness_only=True))
+
+    def add(self, check) -> None:
+        """Start probing a check registered after `start()`; safe to call from any thread."""
+        loop = self._loop
+        if not self._started or loop is None or loop.is_closed():
+            return
+
+        def _spawn() -> None:
+            if self._started:
+                self._tasks.append(loop.create_task(self._loop_one(check, probe_first=True)))
+
+        loop.call_soon_threadsafe(_spawn)
+
+    def _after_fork(self) -> None:
+        # The probe tasks belong to the parent's loop; a child restarts them on first use.
+        self._tasks = []
+        self._started = False
+        self._loop = None
+
+    async def stop(self) -> None:
+        for t in self._tasks:
+            t.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks = []
+        self._started = False
+        self._loop = None
+
+    def snapshot(self, *, readiness_only: bool = False) -> OverallHealthResponse:
+        now = time.monotonic()
+        selected = [c for c in self._registry._checks if not readiness_only or c.config.readiness]
+        stale = tuple(
+            c.config.name
+            for c in selected
+            if c.config.name in self._latest and now - self._latest[c.config.name][1] > self._max_age(c)
+        )
+        key = (self._version, len(selected), stale)
+        hit = self._snapshots.get(readiness_only)
+        if hit is not None and hit[0] == key:
+            return hit[1]
+
+        checks_out: Dict[str, HealthCheckResult] = {}
+        overall = HealthStatus.HEALTHY
+        # The response timestamp is the oldest result it contains: the data is at least that fresh.
+        oldest: Optional[datetime] = None
+
+        for c in selected:
+            name = c.config.name
+            entry = self._latest.get(name)
+            if entry is None:
+                res = HealthCheckResult(status=HealthStatus.UNHEALTHY, error="Awaiting first probe")
+            else:
+                res, _, checked_at = entry
+                if name in stale:
+                    res = HealthCheckResult(status=HealthStatus.UNHEALTHY, error=f"Stale result (older than {self._max_age(c):g}s)")
+                if oldest is None or checked_at < oldest:
+                    oldest = checked_at
+            checks_out[name] = res
+            overall = combine_status(overall, res.status)
+
+        snap = OverallHealthResponse(
+            status=overall,
+            timestamp=oldest or datetime.now(timezone.utc),
+            environment=self._registry.environment,
+            checks=checks_out,
+        )
+        self._snapshots[readiness_only] = (key, snap)
+        return snap
@@ -0,0 +1,214 @@
+from __future__ import annotations
+
+import asyncio
+import mmap
+import os
+import struct
+import time
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from typing import TYPE_CHECKING, Optional, Tuple
+
+from .encoding import dumps, loads
+from .models import HealthCheckResult, HealthStatus, OverallHealthResponse
+
+if TYPE_CHECKING:
+    from .registry import HealthRegistry
+
+_MAGIC = b"PCK1"
+# magic, sequence (odd while a write is in progress), written_at (unix time), leader pid, payload length
+_HEADER = struct.Struct("<4sQdII")
+_PAYLOAD_OFFSET = 32
+
+
+@dataclass
+class SharedSnapshotConfig:
+    # Memory-mapped snapshot file; prefer a tmpfs path such as /dev/shm/<service>-health.
+    path: str
+    interval_s: float = 5.0
+    # Snapshots older than this are reported UNHEALTHY. Defaults to 3x interval_s.
+    max_age_s: Optional[float] = None
+    max_bytes: int = 256 * 1024
+    # On start, a follower waits up to this long for the leader's first snapshot.
+    warmup_timeout_s: float = 5.0
+
+
+class SharedSnapshot:
+    """
+    Readiness snapshot shared by all worker processes of one host through a memory-mapped file.
+
+    Workers compete for an exclusive `flock` on `<path>.lock`. The holder (the leader) runs the
+    checks every `interval_s` and publishes the result; every worker serves readiness from the
+    published snapshot. The OS drops the lock when the leader process dies, and another worker
+    takes over on its next attempt.
+    """
+
+    def __init__(self, registry: "HealthRegistry", config: SharedSnapshotConfig) -> None:
+        self._registry = registry
+        self.config = config
+        self._fd: Optional[int] = None
+        self._lock_fd: Optional[int] = None
+        self._map: Optional[mmap.mmap] = None
+        self._task: Optional[asyncio.Task] = None
+        self._start_lock: Optional[asyncio.Lock] = None
+        self.is_leader = False
+        # (sequence, decoded snapshot) of the last read
+        self._cached: Optional[Tuple[int, OverallHealthResponse]] = None
+
+    @property
+    def running(self) -> bool:
+        return self._task is not None
+
+    @property
+    def max_age_s(self) -> float:
+        return self.config.max_age_s if self.config.max_age_s is not None else 3 * self.config.interval_s
+
+    def _open(self) -> None:
+        size = _PAYLOAD_OFFSET + self.config.max_bytes
+        self._fd = os.open(self.config.path, os.O_RDWR | os.O_CREAT, 0o600)
+        if os.fstat(self._fd).st_size < size:
+            os.ftruncate(self._fd, size)
+        self._map = mmap.mmap(self._fd, size)
+        self._lock_fd = os.open(self.config.path + ".lock", os.O_RDWR | os.O_CREAT, 0o600)
+
+    def _try_acquire(self) -> bool:
+        import fcntl
+
+        try:
+            fcntl.flock(self._lock_fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+            return True
+        except OSError:
+            return False
+
+    def _take_over(self) -> None:
+        """Called on acquiring the lease: an odd header means the last leader died mid-publish."""
+        assert self._map is not None
+        _, seq, _, _, _ = _HEADER.unpack_from(self._map, 0)
+        if seq % 2:
+            # The payload may be torn; mark "no snapshot" until our first publish.
+            _HEADER.pack_into(self._map, 0, _MAGIC, seq + 1, 0.0, os.getpid(), 0)
+
+    async def _cycle(self) -> None:
+        if not self.is_leader:
+            self.is_leader = self._try_acquire()
+            if self.is_leader:
+                self._take_over()
+        if self.is_leader:
+            try:
+                self.publish(await self._registry.run(readiness_only=True))
+            except Exception:
+                # A failed publish shows up to readers as a stale snapshot.
+                pass
+        else:
+            # Followers forward the leader's snapshots to their own subscribers.
+            self._registry.events.publish(self.snapshot())
+
+    async def _lease_loop(self) -> None:
+        while True:
+            await asyncio.sleep(self.config.interval_s)
+            await self._cycle()
+
+    async def start(self) -> None:
+        if self._start_lock is None:
+            self._start_lock = asyncio.Lock()
+        async with self._start_lock:
+            if self._task is not None:
+                return
+            self._open()
+            # Warm up like the scheduler does, so the first readiness answer is meaningful:
+            # a leader publishes once, a follower waits (bounded) for a published snapshot.
+            self.is_leader = self._try_acquire()
+            if self.is_leader:
+                self._take_over()
+            else:
+                deadline = time.monotonic() + self.config.warmup_timeout_s
+                while self._read() is None and time.monotonic() < deadline:
+                    await asyncio.sleep(0.05)
+            await self._cycle()
+            self._task = asyncio.create_task(self._lease_loop())
+
+    async def stop(self) -> None:
+        task, self._task = self._task, None
+        if task is not None:
+            task.cancel()
+            await asyncio.gather(task, return_exceptions=True)
+        for fd in (self._lock_fd, self._fd):
+            if fd is not None:
+                os.close(fd)  # also releases the lease
+        if self._map is not None:
+            self._map.close()
+        self._fd = self._lock_fd = self._map = None
+        self.is_leader = False
+
+    def publish(self, res: OverallHealthResponse) -> None:
+        assert self._map is not None
+        payload = dumps(res.to_dict())
+        if len(payload) > self.config.max_bytes:
+            raise ValueError(f"Snapshot is {len(payload)} bytes, max_bytes is {self.config.max_bytes}")
+        _, seq, written_at, _, length = _HEADER.unpack_from(self._map, 0)
+        # Round up to even: a header left odd by a crashed writer must not flip the parity.
+        seq += seq & 1
+        # Seqlock: readers retry while the sequence is odd or changed under them. The odd
+        # header keeps the previous time and length, so it never reads as "no snapshot".
+        _HEADER.pack_into(self._map, 0, _MAGIC, seq + 1, written_at, os.getpid(), length)
+        self._map[_PAYLOAD_OFFSET:_PAYLOAD_OFFSET + len(payload)] = payload
+        _HEADER.pack_into(self._map, 0, _MAGIC, seq + 2, time.time(), os.getpid(), len(payload))
+
+    def _read(self) -> Optional[Tuple[int, float, bytes]]:
+        assert self._map is not None
+        for _ in range(100):
+            magic, seq, written_at, _, length = _HEADER.unpack_from(self._map, 0)
+            if magic != _MAGIC:
+                return None
+            if seq % 2:
+                time.sleep(0)
+                continue
+            if length == 0:
+                return None
+            payload = self._map[_PAYLOAD_OFFSET:_PAYLOAD_OFFSET + length]
+            if _HEADER.unpack_from(self._map, 0)[1] == seq:
+                return seq, written_at, payload
+        return None
+
+    def snapshot(self) -> OverallHealthResponse:
+        assert self._map is not None
+        _, seq, written_at, _, _ = _HEADER.unpack_from(self._map, 0)
+        if self._cached is not None and self._cached[0] == seq and time.time() - written_at <= self.max_age_s:
+            return self._cached[1]
+
+        entry = self._read()
+        if entry is not None:
+            seq, written_at, payload = entry
+        elif seq % 2 and self._cached is not None:
+            # Still being published after the retries: the previous snapshot stands
+            # (the odd header carries its written_at).
+            seq, payload = self._cached[0], b""
+        else:
+            return self._unavailable("Awaiting first probe")
+
+        age = time.time() - written_at
+        if age > self.max_age_s:
+            return self._unavailable(f"Stale result (older than {self.max_age_s:g}s)")
+
+        if self._cached is None or self._cached[0] != seq:
+            self._cached = (seq, OverallHealthResponse.from_dict(loads(payload)))
+        return self._cached[1]
+
+    @property
+    def version(self) -> int:
+        """Sequence number of the published snapshot; changes on every publish."""
+        entry = self._read()
+        return entry[0] if entry is not None else 0
+
+    def _unavailable(self, error: str) -> OverallHealthResponse:
+        checks = {
+            c.config.name: HealthCheckResult(status=HealthStatus.UNHEALTHY, error=error)
+            for c in self._registry._checks
+            if c.config.readiness
+        }
+        return OverallHealthResponse(
+            status=HealthStatus.UNHEALTHY,
+            timestamp=datetime.now(timezone.utc),
+            environment=self._registry.environment,
+            checks=checks,
+        )
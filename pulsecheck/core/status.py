@@ -13,13 +13,15 @@ def http_status_from_health(status: HealthStatus) -> int:
     return int(http.HTTPStatus.SERVICE_UNAVAILABLE)
 
 
+_SEVERITY = (HealthStatus.HEALTHY, HealthStatus.DEGRADED, HealthStatus.UNHEALTHY)
+
+# _COMBINED[current][incoming] -> the worse of the two
+_COMBINED = {a: {b: max(a, b, key=_SEVERITY.index) for b in _SEVERITY} for a in _SEVERITY}
+
+
 def combine_status(current: HealthStatus, incoming: HealthStatus) -> HealthStatus:
     """
     HEALTHY + DEGRADED => DEGRADED
     Any UNHEALTHY => UNHEALTHY
     """
-    if current == HealthStatus.UNHEALTHY or incoming == HealthStatus.UNHEALTHY:
-        return HealthStatus.UNHEALTHY
-    if current == HealthStatus.DEGRADED or incoming == HealthStatus.DEGRADED:
-        return HealthStatus.DEGRADED
-    return HealthStatus.HEALTHY
+    return _COMBINED[current][incoming]
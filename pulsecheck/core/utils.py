@@ -4,6 +4,8 @@ import asyncio
 import time
 from typing import Awaitable, Callable, TypeVar
 
+from .executor import current_check, default_executor
+
 T = TypeVar("T")
 
 
@@ -16,4 +18,9 @@ async def with_timeout(awaitable: Awaitable[T], timeout_s: float) -> T:
 
 
 async def to_thread(fn: Callable[[], T]) -> T:
-    return await asyncio.to_thread(fn)
+    # Blocking checks run on the health check pool, never the loop's default executor.
+    cur = current_check.get()
+    if cur is None:
+        return await default_executor().run(fn)
+    executor, name = cur
+    return await executor.run(fn, key=name)
@@ -1,3 +1,24 @@
-from .urls import make_urlpatterns
+from typing import TYPE_CHECKING
 
-__all__ = ["make_urlpatterns"]
+if TYPE_CHECKING:
+    from .middleware import HealthASGIMiddleware, HealthWSGIMiddleware
+    from .urls import make_urlpatterns
+
+__all__ = ["make_urlpatterns", "HealthASGIMiddleware", "HealthWSGIMiddleware"]
+
+
+def __getattr__(name: str):
+    # Django is only imported for the URL patterns; the middleware is framework-free.
+    if name == "make_urlpatterns":
+        from .urls import make_urlpatterns
+        return make_urlpatterns
+
+    if name == "HealthASGIMiddleware":
+        from .middleware import HealthASGIMiddleware
+        return HealthASGIMiddleware
+
+    if name == "HealthWSGIMiddleware":
+        from .middleware import HealthWSGIMiddleware
+        return HealthWSGIMiddleware
+
+    raise AttributeError(f"module {__name__} has no attribute {name}")
@@ -1,14 +1,26 @@
 from __future__ import annotations
 
 from django.urls import path  # type: ignore
-from .views import make_views
+from .views import make_group_view, make_metrics_view, make_stream_view, make_views
 
 
-def make_urlpatterns(registry, *, base_path: str = "health/"):
-    health_view, ready_view = make_views(registry)
+def make_urlpatterns(registry, *, base_path: str = "health/", groups=None, asgi: bool = False):
+    """
+    Health URL patterns; `ready/<group>/` is added for each of `groups` (default: every
+    registered tag). Pass `asgi=True` when Django is served over ASGI to get async views
+    and the `stream/` endpoint, which never ends and so would pin a WSGI worker.
+    """
+    health_view, ready_view = make_views(registry, asgi=asgi)
+    group_patterns = [
+        path(base_path + f"ready/{group}/", make_group_view(registry, group, asgi=asgi))
+        for group in (registry.groups if groups is None else groups)
+    ]
 
     return [
         path(base_path, health_view),
         path(base_path + "live/", health_view),
         path(base_path + "ready/", ready_view),
+        path(base_path + "metrics/", make_metrics_view(registry)),
+        *([path(base_path + "stream/", make_stream_view(registry))] if asgi else []),
+        *group_patterns,
     ]
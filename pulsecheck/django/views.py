@@ -1,16 +1,77 @@
 from __future__ import annotations
 
-from django.http import JsonResponse  # type: ignore
-from pulsecheck.core import HealthRegistry, http_status_from_health
+import asyncio
+from typing import Optional
 
+from django.http import HttpResponse, HttpResponseNotModified, StreamingHttpResponse  # type: ignore
+from pulsecheck.core import HealthRegistry, OverallHealthResponse, render_prometheus
+from pulsecheck.core.metrics import CONTENT_TYPE as METRICS_CONTENT_TYPE
+from pulsecheck.core.pubsub import sse_encode
+
+
+def make_views(registry: HealthRegistry, *, asgi: bool = False):
+    """
+    Checks always run on the registry's background loop (one per process), never on a
+    per-request loop. With `asgi=False` the views are plain sync views, so WSGI Django
+    calls them directly; with `asgi=True` they are async views awaiting that loop.
+    The loop starts on the first readiness request, so each forked worker gets its own.
+    """
 
-def make_views(registry: HealthRegistry):
     def health(request):
-        res = registry.liveness()
-        return JsonResponse(res.to_dict(), status=http_status_from_health(res.status))
+        return _respond(registry, registry.liveness(), request, key="live")
+
+    return health, _ready_view(registry, None, asgi=asgi)
+
+
+def make_group_view(registry: HealthRegistry, group: str, *, asgi: bool = False):
+    return _ready_view(registry, group, asgi=asgi)
+
+
+def _ready_view(registry: HealthRegistry, group: Optional[str], *, asgi: bool):
+    key = registry.plan(group).key
+
+    if asgi:
+        async def ready(request):
+            res = registry.snapshot(group)
+            if res is None:
+                res = await asyncio.wrap_future(registry.submit(registry.readiness(group)))
+            return _respond(registry, res, request, key=key)
+    else:
+        def ready(request):
+            return _respond(registry, registry.readiness_sync(group), request, key=key)
+
+    return ready
+
+
+def make_metrics_view(registry: HealthRegistry):
+    def metrics(request):
+        return HttpResponse(render_prometheus(registry), content_type=METRICS_CONTENT_TYPE)
+
+    return metrics
+
+
+def make_stream_view(registry: HealthRegistry):
+    # Streams forever, so it needs an ASGI server; under WSGI use polling instead.
+    async def stream(request):
+        # Probing stays on the background loop; this request's loop only relays events.
+        registry.start_background()
+
+        async def _events():
+            async for event in registry.subscribe():
+                yield sse_encode(event)
+
+        response = StreamingHttpResponse(_events(), content_type="text/event-stream")
+        response["Cache-Control"] = "no-cache"
+        return response
+
+    return stream
 
-    async def ready(request):
-        res = await registry.readiness()
-        return JsonResponse(res.to_dict(), status=http_status_from_health(res.status))
 
-    return health, ready
+def _respond(registry: HealthRegistry, res: OverallHealthResponse, request, *, key: str) -> HttpResponse:
+    enc = registry.encode(res, key=key)
+    if enc.not_modified(request.headers.get("If-None-Match")):
+        response = HttpResponseNotModified()
+    else:
+        response = HttpResponse(enc.body, status=enc.status_code, content_type="application/json")
+    response["ETag"] = enc.etag
+    return response
@@ -1,3 +1,20 @@
-from .router import make_health_router
+from typing import TYPE_CHECKING
 
-__all__ = ["make_health_router"]
+if TYPE_CHECKING:
+    from .middleware import HealthASGIMiddleware
+    from .router import make_health_router
+
+__all__ = ["make_health_router", "HealthASGIMiddleware"]
+
+
+def __getattr__(name: str):
+    # FastAPI itself is only imported for the router; the middleware is framework-free.
+    if name == "make_health_router":
+        from .router import make_health_router
+        return make_health_router
+
+    if name == "HealthASGIMiddleware":
+        from .middleware import HealthASGIMiddleware
+        return HealthASGIMiddleware
+
+    raise AttributeError(f"module {__name__} has no attribute {name}")
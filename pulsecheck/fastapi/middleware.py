@@ -0,0 +1,5 @@
+from __future__ import annotations
+
+from pulsecheck.core.middleware import HealthASGIMiddleware
+
+__all__ = ["HealthASGIMiddleware"]
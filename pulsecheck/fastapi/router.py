@@ -1,43 +1,65 @@
 from __future__ import annotations
 
-from fastapi import APIRouter, Response
-from pulsecheck.core import HealthRegistry, http_status_from_health
+from typing import Optional, Sequence
 
+from fastapi import APIRouter, Request, Response
+from fastapi.responses import StreamingResponse
+from pulsecheck.core import HealthRegistry, OverallHealthResponse, render_prometheus
+from pulsecheck.core.metrics import CONTENT_TYPE as METRICS_CONTENT_TYPE
+from pulsecheck.core.pubsub import sse_encode
 
-def make_health_router(registry: HealthRegistry, *, prefix: str = "/health") -> APIRouter:
+
+def make_health_router(registry: HealthRegistry, *, prefix: str = "/health", groups: Optional[Sequence[str]] = None) -> APIRouter:
+    """Health routes; `/ready/<group>` is mounted for each of `groups` (default: every registered tag)."""
     router = APIRouter(prefix=prefix, tags=["Health"])
 
     @router.get("")
-    async def health() -> Response:
-        res = registry.liveness()
-        return Response(
-            content=_json(res.to_dict()),
-            status_code=http_status_from_health(res.status),
-            media_type="application/json",
-        )
+    async def health(request: Request) -> Response:
+        return _respond(registry, registry.liveness(), request, key="live")
 
     @router.get("/live")
-    async def live() -> Response:
-        res = registry.liveness()
-        return Response(
-            content=_json(res.to_dict()),
-            status_code=http_status_from_health(res.status),
-            media_type="application/json",
-        )
+    async def live(request: Request) -> Response:
+        return _respond(registry, registry.liveness(), request, key="live")
 
     @router.get("/ready")
-    async def ready() -> Response:
-        res = await registry.readiness()
-        return Response(
-            content=_json(res.to_dict()),
-            status_code=http_status_from_health(res.status),
-            media_type="application/json",
-        )
+    async def ready(request: Request) -> Response:
+        return _respond(registry, await registry.readiness(), request, key="ready")
+
+    for group in registry.groups if groups is None else groups:
+        router.add_api_route(f"/ready/{group}", _group_endpoint(registry, group), methods=["GET"])
+
+    @router.get("/metrics")
+    async def metrics() -> Response:
+        return Response(content=render_prometheus(registry), media_type=METRICS_CONTENT_TYPE)
+
+    @router.get("/stream")
+    async def stream() -> StreamingResponse:
+        async def _events():
+            async for event in registry.subscribe():
+                yield sse_encode(event)
+
+        return StreamingResponse(_events(), media_type="text/event-stream", headers={"Cache-Control": "no-cache"})
 
     return router
 
 
-def _json(payload: dict) -> str:
-    # avoid adding pydantic dependency in the lib
-    import json
-    return json.dumps(payload, ensure_ascii=False, separators=(",", ":"))
+def _group_endpoint(registry: HealthRegistry, group: str):
+    key = registry.plan(group).key
+
+    async def ready_group(request: Request) -> Response:
+        return _respond(registry, await registry.readiness(group), request, key=key)
+
+    ready_group.__name__ = f"ready_{group}"
+    return ready_group
+
+
+def _respond(registry: HealthRegistry, res: OverallHealthResponse, request: Request, *, key: str) -> Response:
+    enc = registry.encode(res, key=key)
+    if enc.not_modified(request.headers.get("if-none-match")):
+        return Response(status_code=304, headers={"ETag": enc.etag})
+    return Response(
+        content=enc.body,
+        status_code=enc.status_code,
+        media_type="application/json",
+        headers={"ETag": enc.etag},
+    )